@@ -203,6 +203,26 @@ def _prewarm_process_worker(runtime: RuntimeConfig) -> Any | None:
         return None
 
 
+def _install_event_loop_policy() -> None:
+    """Run Textual on uvloop when it is installed.
+
+    uvloop replaces the pure-Python selector loop with libuv, which lowers
+    per-callback overhead for UI ticks and worker completions. It is an
+    optional extra and unsupported on Windows, so any failure keeps the
+    default asyncio loop.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import asyncio
+
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except Exception:
+        pass
+
+
 def _run_app(app: Any) -> int:
     exit_code: int | None = None
     handled_signals = [signal.SIGINT, signal.SIGTERM]
@@ -237,6 +257,7 @@ def _run_app(app: Any) -> int:
 
     try:
         _sane_tty()
+        _install_event_loop_policy()
         app.run()
     except KeyboardInterrupt:
         _sane_tty()
@@ -284,6 +305,40 @@ def _add_stdin_secret_flags(parser: argparse.ArgumentParser, *, include_ssh: boo
         )
 
 
+# Subcommands whose parsers carry one sub-parser per provider schema.
+_PROVIDER_PARSER_COMMANDS = frozenset({"connect", "connections", "connection"})
+
+
+def _needs_provider_parsers(argv: list[str]) -> bool:
+    """Return True if argv may reach a per-provider sub-parser.
+
+    Building those sub-parsers walks every provider schema, so the TUI
+    launch and unrelated commands skip it. Any occurrence of a provider
+    command counts, which errs on the side of building them.
+    """
+    return not _PROVIDER_PARSER_COMMANDS.isdisjoint(argv)
+
+
+def _add_provider_parsers(provider_parsers: Any, *, name_required: bool) -> None:
+    """Add one sub-parser per supported provider with its schema options."""
+    for db_type in get_supported_db_types():
+        schema = get_provider_schema(db_type)
+        provider_parser = provider_parsers.add_parser(
+            db_type,
+            help=f"{schema.display_name} options",
+            description=f"{schema.display_name} connection options",
+        )
+        add_schema_arguments(provider_parser, schema, include_name=True, name_required=name_required)
+        provider_parser.add_argument("--password-command", dest="password_command", help="Shell command to retrieve the database password")
+        provider_parser.add_argument("--ssh-password-command", dest="ssh_password_command", help="Shell command to retrieve the SSH password")
+        _add_stdin_secret_flags(provider_parser, include_ssh=True)
+        provider_parser.add_argument(
+            "--alert",
+            metavar="MODE",
+            help="Per-connection query alert mode: off|delete|write",
+        )
+
+
 def _resolve_stdin_secrets(args: argparse.Namespace) -> None:
     """Populate args.password / args.url / args.ssh_password from stdin if requested.
 
@@ -655,6 +710,7 @@ def main() -> int:
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    build_provider_parsers = _needs_provider_parsers(filtered_argv[1:])
 
     conn_parser = subparsers.add_parser(
         "connections",
@@ -691,22 +747,8 @@ def main() -> int:
         help="Connection name (required when using --url / --url-stdin)",
     )
     add_provider_parsers = add_parser.add_subparsers(dest="provider", metavar="PROVIDER")
-    for db_type in get_supported_db_types():
-        schema = get_provider_schema(db_type)
-        provider_parser = add_provider_parsers.add_parser(
-            db_type,
-            help=f"{schema.display_name} options",
-            description=f"{schema.display_name} connection options",
-        )
-        add_schema_arguments(provider_parser, schema, include_name=True, name_required=True)
-        provider_parser.add_argument("--password-command", dest="password_command", help="Shell command to retrieve the database password")
-        provider_parser.add_argument("--ssh-password-command", dest="ssh_password_command", help="Shell command to retrieve the SSH password")
-        _add_stdin_secret_flags(provider_parser, include_ssh=True)
-        provider_parser.add_argument(
-            "--alert",
-            metavar="MODE",
-            help="Per-connection query alert mode: off|delete|write",
-        )
+    if build_provider_parsers:
+        _add_provider_parsers(add_provider_parsers, name_required=True)
 
     edit_parser = conn_subparsers.add_parser("edit", help="Edit an existing connection")
     edit_parser.add_argument("connection_name", help="Name of connection to edit")
@@ -742,22 +784,8 @@ def main() -> int:
 
     connect_parser = subparsers.add_parser("connect", help="Temporary connection (not saved)")
     connect_provider_parsers = connect_parser.add_subparsers(dest="provider", metavar="PROVIDER")
-    for db_type in get_supported_db_types():
-        schema = get_provider_schema(db_type)
-        provider_parser = connect_provider_parsers.add_parser(
-            db_type,
-            help=f"{schema.display_name} options",
-            description=f"{schema.display_name} connection options",
-        )
-        add_schema_arguments(provider_parser, schema, include_name=True, name_required=False)
-        provider_parser.add_argument("--password-command", dest="password_command", help="Shell command to retrieve the database password")
-        provider_parser.add_argument("--ssh-password-command", dest="ssh_password_command", help="Shell command to retrieve the SSH password")
-        _add_stdin_secret_flags(provider_parser, include_ssh=True)
-        provider_parser.add_argument(
-            "--alert",
-            metavar="MODE",
-            help="Per-connection query alert mode: off|delete|write",
-        )
+    if build_provider_parsers:
+        _add_provider_parsers(connect_provider_parsers, name_required=False)
 
     query_parser = subparsers.add_parser("query", help="Execute a SQL query")
     query_parser.add_argument("--connection", "-c", required=True, help="Connection name to use")
@@ -6,8 +6,26 @@ from collections.abc import Callable
 
 from sqlit.core.binding_contexts import get_binding_contexts
 from sqlit.core.input_context import InputContext
-from sqlit.core.keymap import get_keymap
-from sqlit.core.leader_commands import get_leader_commands
+from sqlit.core.keymap import ActionKeyDef, KeymapProvider, get_keymap
+from sqlit.core.leader_commands import get_leader_commands_by_key
+
+# Action keys grouped by key string for the active keymap provider, in keymap
+# order. Like the leader command cache, this is rebuilt when the provider
+# identity changes (set_keymap/reset_keymap install a fresh provider).
+_index_provider: KeymapProvider | None = None
+_action_key_index: dict[str, tuple[ActionKeyDef, ...]] = {}
+
+
+def _get_action_key_index() -> dict[str, tuple[ActionKeyDef, ...]]:
+    global _index_provider, _action_key_index
+    keymap = get_keymap()
+    if keymap is not _index_provider:
+        grouped: dict[str, list[ActionKeyDef]] = {}
+        for action_key in keymap.get_action_keys():
+            grouped.setdefault(action_key.key, []).append(action_key)
+        _action_key_index = {key: tuple(defs) for key, defs in grouped.items()}
+        _index_provider = keymap
+    return _action_key_index
 
 
 def resolve_action(
@@ -24,16 +42,17 @@ def resolve_action(
         is_allowed: Callable that checks if an action is allowed in the current state.
     """
     if ctx.leader_pending:
-        for cmd in get_leader_commands(ctx.leader_menu):
-            if cmd.key == key and cmd.is_allowed(ctx):
+        for cmd in get_leader_commands_by_key(ctx.leader_menu).get(key, ()):
+            if cmd.is_allowed(ctx):
                 return cmd.binding_action
         return None
 
+    candidates = _get_action_key_index().get(key)
+    if not candidates:
+        return None
+
     contexts = get_binding_contexts(ctx)
-    keymap = get_keymap()
-    for action_key in keymap.get_action_keys():
-        if action_key.key != key:
-            continue
+    for action_key in candidates:
         if action_key.context is not None and action_key.context not in contexts:
             continue
         if is_allowed(action_key.action):
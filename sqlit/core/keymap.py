@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from sqlit.shared.core.debug_events import emit_debug_event
@@ -80,9 +81,21 @@ class KeymapProvider(ABC):
         """Get all regular action key definitions."""
         raise NotImplementedError
 
+    def _leader_command_view(self) -> Sequence[LeaderCommandDef]:
+        """Read-only leader commands for the lookup helpers below.
+
+        Defaults to :meth:`get_leader_commands`; providers holding an
+        immutable snapshot override this to skip the defensive copy.
+        """
+        return self.get_leader_commands()
+
+    def _action_key_view(self) -> Sequence[ActionKeyDef]:
+        """Read-only action keys for the lookup helpers below."""
+        return self.get_action_keys()
+
     def leader(self, action: str, menu: str | None = "leader") -> str | None:
         """Get the key for a leader command action."""
-        for cmd in self.get_leader_commands():
+        for cmd in self._leader_command_view():
             if cmd.action == action and (menu is None or cmd.menu == menu):
                 return cmd.key
         return None
@@ -91,7 +104,7 @@ class KeymapProvider(ABC):
         """Get the key for a regular action."""
         primary = None
         fallback = None
-        for ak in self.get_action_keys():
+        for ak in self._action_key_view():
             if ak.action != action_name:
                 continue
             if fallback is None:
@@ -105,7 +118,7 @@ class KeymapProvider(ABC):
         primary_keys: list[str] = []
         secondary_keys: list[str] = []
         seen: set[str] = set()
-        for ak in self.get_action_keys():
+        for ak in self._action_key_view():
             if ak.action != action_name:
                 continue
             if ak.key in seen:
@@ -119,7 +132,7 @@ class KeymapProvider(ABC):
 
     def actions_for_key(self, key: str) -> list[str]:
         """Get all actions bound to a key."""
-        return [ak.action for ak in self.get_action_keys() if ak.key == key]
+        return [ak.action for ak in self._action_key_view() if ak.key == key]
 
 
 class DefaultKeymapProvider(KeymapProvider):
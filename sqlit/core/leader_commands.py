@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from sqlit.core.input_context import InputContext
-from sqlit.core.keymap import get_keymap
+from sqlit.core.keymap import KeymapProvider, get_keymap
 
 LEADER_GUARDS: dict[str, Callable[[InputContext], bool]] = {
     "has_connection": lambda ctx: ctx.has_connection,
@@ -38,9 +39,18 @@ class LeaderCommand:
         return self.guard(ctx)
 
 
-def _build_leader_commands(menu: str = "leader") -> list[LeaderCommand]:
+# Built leader commands per menu for the active keymap provider. Keymap
+# changes always install a new provider (set_keymap/reset_keymap), so the
+# provider's identity is enough to know when the cache is stale.
+_cache_provider: KeymapProvider | None = None
+_commands_cache: dict[str, tuple[LeaderCommand, ...]] = {}
+_binding_actions_cache: dict[str, frozenset[str]] = {}
+_by_action_cache: dict[str, Mapping[str, LeaderCommand]] = {}
+_by_key_cache: dict[str, Mapping[str, tuple[LeaderCommand, ...]]] = {}
+
+
+def _build_leader_commands(keymap: KeymapProvider, menu: str = "leader") -> list[LeaderCommand]:
     """Build leader commands from the keymap provider."""
-    keymap = get_keymap()
     commands: list[LeaderCommand] = []
 
     for cmd_def in keymap.get_leader_commands():
@@ -60,11 +70,59 @@ def _build_leader_commands(menu: str = "leader") -> list[LeaderCommand]:
     return commands
 
 
-def get_leader_commands(menu: str = "leader") -> list[LeaderCommand]:
-    """Get leader commands (rebuilt from keymap each time for testability)."""
-    return _build_leader_commands(menu)
+def _sync_cache_provider() -> KeymapProvider:
+    global _cache_provider
+    keymap = get_keymap()
+    if keymap is not _cache_provider:
+        _commands_cache.clear()
+        _binding_actions_cache.clear()
+        _by_action_cache.clear()
+        _by_key_cache.clear()
+        _cache_provider = keymap
+    return keymap
+
+
+def get_leader_commands(menu: str = "leader") -> tuple[LeaderCommand, ...]:
+    """Get leader commands, rebuilt only when the keymap provider changes."""
+    keymap = _sync_cache_provider()
+    commands = _commands_cache.get(menu)
+    if commands is None:
+        commands = tuple(_build_leader_commands(keymap, menu))
+        _commands_cache[menu] = commands
+    return commands
 
 
-def get_leader_binding_actions(menu: str = "leader") -> set[str]:
+def get_leader_binding_actions(menu: str = "leader") -> frozenset[str]:
     """Get set of leader binding action names."""
-    return {cmd.binding_action for cmd in get_leader_commands(menu)}
+    _sync_cache_provider()
+    actions = _binding_actions_cache.get(menu)
+    if actions is None:
+        actions = frozenset(cmd.binding_action for cmd in get_leader_commands(menu))
+        _binding_actions_cache[menu] = actions
+    return actions
+
+
+def get_leader_commands_by_action(menu: str = "leader") -> Mapping[str, LeaderCommand]:
+    """Get leader commands keyed by binding action (first definition wins)."""
+    _sync_cache_provider()
+    by_action = _by_action_cache.get(menu)
+    if by_action is None:
+        index: dict[str, LeaderCommand] = {}
+        for cmd in get_leader_commands(menu):
+            index.setdefault(cmd.binding_action, cmd)
+        by_action = MappingProxyType(index)
+        _by_action_cache[menu] = by_action
+    return by_action
+
+
+def get_leader_commands_by_key(menu: str = "leader") -> Mapping[str, tuple[LeaderCommand, ...]]:
+    """Get leader commands grouped by key, in keymap order within each key."""
+    _sync_cache_provider()
+    by_key = _by_key_cache.get(menu)
+    if by_key is None:
+        grouped: dict[str, list[LeaderCommand]] = {}
+        for cmd in get_leader_commands(menu):
+            grouped.setdefault(cmd.key, []).append(cmd)
+        by_key = MappingProxyType({key: tuple(cmds) for key, cmds in grouped.items()})
+        _by_key_cache[menu] = by_key
+    return by_key
@@ -113,6 +113,8 @@ class State(ABC):
         self._forbidden: set[str] = set()
         self._display_order: list[str] = []
         self._right_bindings: list[str] = []
+        # Per-action resolution of the parent chain (see _resolve_action).
+        self._resolved_actions: dict[str, ActionSpec | ActionResult | State] = {}
         self._setup_actions()
 
     @abstractmethod
@@ -132,6 +134,7 @@ class State(ABC):
         help_key: str | None = None,
     ) -> None:
         """Register an action as allowed in this state."""
+        self._resolved_actions.clear()
         self._actions[action_name] = ActionSpec(
             guard=guard,
             display_key=key,
@@ -160,23 +163,44 @@ class State(ABC):
 
     def forbids(self, *action_names: str) -> None:
         """Explicitly forbid actions (blocks parent allowance)."""
+        self._resolved_actions.clear()
         self._forbidden.update(action_names)
 
     def check_action(self, app: InputContext, action_name: str) -> ActionResult:
         """Check if action is allowed in this state or ancestors."""
-        if action_name in self._forbidden:
-            return ActionResult.FORBIDDEN
+        resolved = self._resolved_actions.get(action_name)
+        if resolved is None:
+            resolved = self._resolve_action(action_name)
+            self._resolved_actions[action_name] = resolved
 
-        if action_name in self._actions:
-            spec = self._actions[action_name]
-            if spec.is_allowed(app):
+        if isinstance(resolved, ActionSpec):
+            if resolved.is_allowed(app):
                 return ActionResult.ALLOWED
             return ActionResult.FORBIDDEN
+        if isinstance(resolved, State):
+            return resolved.check_action(app, action_name)
+        return resolved
 
-        if self.parent:
-            return self.parent.check_action(app, action_name)
+    def _resolve_action(self, action_name: str) -> ActionSpec | ActionResult | State:
+        """Walk the parent chain once for an action.
+
+        Returns the spec whose guard decides the action, a fixed result, or the
+        ancestor whose custom ``check_action`` must be consulted at call time.
+        Only the guard depends on the input context, so the walk is cached.
+        """
+        if action_name in self._forbidden:
+            return ActionResult.FORBIDDEN
+
+        spec = self._actions.get(action_name)
+        if spec is not None:
+            return spec
 
-        return ActionResult.UNHANDLED
+        parent = self.parent
+        if parent is None:
+            return ActionResult.UNHANDLED
+        if type(parent).check_action is not State.check_action:
+            return parent
+        return parent._resolve_action(action_name)
 
     def get_display_bindings(self, app: InputContext) -> tuple[list[DisplayBinding], list[DisplayBinding]]:
         """Get bindings to display in footer (left, right)."""
@@ -7,6 +7,7 @@ can be used from adapters, services, and UI screens.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from sqlit.shared.core.system_probe import SystemProbe, SystemProbeProtocol
 
@@ -72,9 +73,8 @@ def _install_paths_writable(probe: SystemProbeProtocol) -> bool:
     return probe.install_paths_writable()
 
 
-def _get_arch_package_name(package_name: str) -> str | None:
-    """Map PyPI package name to Arch Linux package name."""
-    mapping = {
+_ARCH_PACKAGE_NAMES = MappingProxyType(
+    {
         "psycopg2-binary": "python-psycopg2",
         "psycopg2": "python-psycopg2",
         "mssql-python": "python-mssql",
@@ -88,7 +88,12 @@ def _get_arch_package_name(package_name: str) -> str | None:
         "paramiko": "python-paramiko",
         "sshtunnel": "python-sshtunnel",
     }
-    return mapping.get(package_name)
+)
+
+
+def _get_arch_package_name(package_name: str) -> str | None:
+    """Map PyPI package name to Arch Linux package name."""
+    return _ARCH_PACKAGE_NAMES.get(package_name)
 
 
 @dataclass(frozen=True)
@@ -27,11 +27,7 @@ def build_mock_provider(db_type: str, adapter: MockDatabaseAdapter) -> DatabaseP
         schema = real_provider.schema
         driver = real_provider.driver
         docker_detector = real_provider.docker_detector
-
-        def _display_info(config: ConnectionConfig) -> str:
-            return real_provider.display_info(config)
-
-        display_info = _display_info
+        display_info = real_provider.display_info
     else:
         spec = None
         try:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
@@ -99,7 +100,7 @@ AUTH_TYPE_LABELS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class TcpEndpoint:
     host: str = ""
     port: str = ""
@@ -112,13 +113,13 @@ class TcpEndpoint:
     original_host: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileEndpoint:
     path: str = ""
     kind: str = "file"
 
 
-@dataclass
+@dataclass(slots=True)
 class TunnelConfig:
     enabled: bool = False
     host: str = ""
@@ -130,7 +131,7 @@ class TunnelConfig:
     key_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionConfig:
     """Database connection configuration."""
 
@@ -151,6 +152,10 @@ class ConnectionConfig:
         db_type = payload.get("db_type")
         if not isinstance(db_type, str) or not db_type:
             payload["db_type"] = "mssql"
+        else:
+            # Every saved connection repeats one of a few dozen type names;
+            # share a single string per type instead of one per record.
+            payload["db_type"] = sys.intern(db_type)
 
         raw_options = payload.pop("options", None)
         options: dict[str, Any] = {}
@@ -42,13 +42,10 @@ class AdapterConfigValidator(ConfigValidator):
 
 
 def _build_metadata(spec: ProviderSpec, url_schemes: tuple[str, ...]) -> ProviderMetadata:
-    badge_label = spec.badge_label or spec.display_name
-    if not badge_label:
-        badge_label = spec.db_type.upper()
     return ProviderMetadata(
         db_type=spec.db_type,
         display_name=spec.display_name,
-        badge_label=badge_label,
+        badge_label=spec.resolved_badge_label,
         default_port=spec.default_port,
         supports_ssh=spec.supports_ssh,
         is_file_based=spec.is_file_based,
@@ -118,32 +118,31 @@ class Db2Adapter(CursorBasedAdapter):
         schema = (schema or "").upper()
         table_name = table.upper()
 
-        pk_columns: set[str] = set()
         if not schema:
             cursor.execute("SELECT CURRENT SCHEMA FROM sysibm.sysdummy1")
             row = cursor.fetchone()
             schema = str(row[0]) if row else ""
-        if schema:
-            cursor.execute(
-                "SELECT k.colname "
-                "FROM syscat.tabconst c "
-                "JOIN syscat.keycoluse k "
-                "  ON c.constname = k.constname "
-                " AND c.tabschema = k.tabschema "
-                " AND c.tabname = k.tabname "
-                "WHERE c.type = 'P' AND c.tabschema = ? AND c.tabname = ?",
-                (schema, table_name),
-            )
-            pk_columns = {row[0] for row in cursor.fetchall()}
 
+        # A table has at most one primary key, so the LEFT JOINs add no rows.
         cursor.execute(
-            "SELECT colname, typename FROM syscat.columns "
-            "WHERE tabschema = ? AND tabname = ? "
-            "ORDER BY colno",
+            "SELECT c.colname, c.typename, "
+            "       CASE WHEN k.colname IS NULL THEN 0 ELSE 1 END "
+            "FROM syscat.columns c "
+            "LEFT JOIN syscat.tabconst tc "
+            "  ON tc.tabschema = c.tabschema "
+            " AND tc.tabname = c.tabname "
+            " AND tc.type = 'P' "
+            "LEFT JOIN syscat.keycoluse k "
+            "  ON k.constname = tc.constname "
+            " AND k.tabschema = tc.tabschema "
+            " AND k.tabname = tc.tabname "
+            " AND k.colname = c.colname "
+            "WHERE c.tabschema = ? AND c.tabname = ? "
+            "ORDER BY c.colno",
             (schema, table_name),
         )
         return [
-            ColumnInfo(name=row[0], data_type=row[1], is_primary_key=row[0] in pk_columns)
+            ColumnInfo(name=row[0], data_type=row[1], is_primary_key=row[2] == 1)
             for row in cursor.fetchall()
         ]
 
@@ -381,39 +381,40 @@ class FirebirdAdapter(CursorBasedAdapter):
         database: str | None = None,
         schema: str | None = None,
     ) -> list[ColumnInfo]:
-        """List the fields of a given table and their types."""
-        cursor = conn.cursor()
-
-        # Find the fields that form part of the primary key
-        cursor.execute(
-            "SELECT    sg.rdb$field_name "
-            "FROM      rdb$indices AS ix "
-            "JOIN      rdb$index_segments AS sg USING (rdb$index_name) "
-            "LEFT JOIN rdb$relation_constraints AS rc USING (rdb$index_name) "
-            "WHERE     rc.rdb$constraint_type = 'PRIMARY KEY' AND rc.rdb$relation_name = ?",
-            (table.upper(),),
-        )
-        pk_fields = set(row[0].rstrip() for row in cursor.fetchall())
+        """List the fields of a given table and their types.
 
-        # Find the fields themselves.
+        Primary-key membership is resolved in the same round trip: a table
+        has at most one PRIMARY KEY constraint, so the LEFT JOINs onto its
+        index segments never duplicate a field row.
+        """
+        cursor = conn.cursor()
         cursor.execute(
-            "SELECT rf.rdb$field_name, f.rdb$field_type, f.rdb$character_length, f.rdb$field_sub_type "
-            "FROM   rdb$relation_fields AS rf "
-            "JOIN   rdb$fields AS f ON f.rdb$field_name = rf.rdb$field_source "
-            "WHERE  rdb$relation_name = ? "
-            "ORDER BY rdb$field_position ASC",
+            "SELECT    rf.rdb$field_name, f.rdb$field_type, f.rdb$character_length, "
+            "          f.rdb$field_sub_type, sg.rdb$field_name "
+            "FROM      rdb$relation_fields AS rf "
+            "JOIN      rdb$fields AS f ON f.rdb$field_name = rf.rdb$field_source "
+            "LEFT JOIN rdb$relation_constraints AS rc "
+            "       ON rc.rdb$relation_name = rf.rdb$relation_name "
+            "      AND rc.rdb$constraint_type = 'PRIMARY KEY' "
+            "LEFT JOIN rdb$index_segments AS sg "
+            "       ON sg.rdb$index_name = rc.rdb$index_name "
+            "      AND sg.rdb$field_name = rf.rdb$field_name "
+            "WHERE     rf.rdb$relation_name = ? "
+            "ORDER BY  rf.rdb$field_position ASC",
             (table.upper(),),
         )
+        type_name = self._types.get
         columns = []
-        for row in cursor.fetchall():
-            if row[1] in [14, 37]:  # CHAR, VARCHAR
-                data_type = f"{self._types[row[1]]}({row[2]})"
-            if row[1] == 261 and row[3] == 1:
+        for name, field_type, char_length, sub_type, pk_field in cursor.fetchall():
+            if field_type in (14, 37):  # CHAR, VARCHAR
+                data_type = f"{type_name(field_type)}({char_length})"
+            elif field_type == 261 and sub_type == 1:
                 data_type = "BLOB (text)"
             else:
-                data_type = self._types.get(row[1], "UNKNOWN")
-            name = row[0].rstrip()
-            columns.append(ColumnInfo(name=name, data_type=data_type, is_primary_key=name in pk_fields))
+                data_type = type_name(field_type, "UNKNOWN")
+            columns.append(
+                ColumnInfo(name=name.rstrip(), data_type=data_type, is_primary_key=pk_field is not None)
+            )
         return columns
 
     def get_procedures(self, conn: Any, database: str | None = None) -> list[str]:
@@ -441,8 +442,14 @@ class FirebirdAdapter(CursorBasedAdapter):
         return f"SELECT * FROM {qualified} WHERE {self.quote_identifier(column)} = {self.quote_literal(value)} ROWS {limit}"
 
     def execute_non_query(self, conn: Any, query: str) -> int:
-        # Firebird has no autocommit mode, so we need to guarantee it ourselves.
+        # Firebird has no autocommit mode. The base class already commits on
+        # success; on failure end the transaction with a rollback instead of
+        # committing it, so nothing half-done is kept open or persisted.
         try:
             return super().execute_non_query(conn, query)
-        finally:
-            conn.commit()
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.connections.providers.catalog import get_provider, get_provider_spec
 
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
+    from sqlit.domains.connections.providers.model import ProviderSpec
 
 
 def _get_provider_or_none(db_type: str) -> Any:
@@ -17,39 +18,48 @@ def _get_provider_or_none(db_type: str) -> Any:
         return None
 
 
+def _get_spec_or_none(db_type: str) -> ProviderSpec | None:
+    # Static metadata comes straight from the registered spec, so label and
+    # flag lookups never have to build the provider or import its adapter.
+    try:
+        return get_provider_spec(db_type)
+    except Exception:
+        return None
+
+
 def get_display_name(db_type: str) -> str:
-    provider = _get_provider_or_none(db_type)
-    return provider.metadata.display_name if provider else db_type
+    spec = _get_spec_or_none(db_type)
+    return spec.display_name if spec else db_type
 
 
 def get_badge_label(db_type: str) -> str:
-    provider = _get_provider_or_none(db_type)
-    return provider.metadata.badge_label if provider else db_type
+    spec = _get_spec_or_none(db_type)
+    return spec.resolved_badge_label if spec else db_type
 
 
 def get_default_port(db_type: str) -> str:
-    provider = _get_provider_or_none(db_type)
-    return provider.metadata.default_port if provider else "1433"
+    spec = _get_spec_or_none(db_type)
+    return spec.default_port if spec else "1433"
 
 
 def supports_ssh(db_type: str) -> bool:
-    provider = _get_provider_or_none(db_type)
-    return provider.metadata.supports_ssh if provider else False
+    spec = _get_spec_or_none(db_type)
+    return spec.supports_ssh if spec else False
 
 
 def is_file_based(db_type: str) -> bool:
-    provider = _get_provider_or_none(db_type)
-    return provider.metadata.is_file_based if provider else False
+    spec = _get_spec_or_none(db_type)
+    return spec.is_file_based if spec else False
 
 
 def has_advanced_auth(db_type: str) -> bool:
-    provider = _get_provider_or_none(db_type)
-    return provider.metadata.has_advanced_auth if provider else False
+    spec = _get_spec_or_none(db_type)
+    return spec.has_advanced_auth if spec else False
 
 
 def requires_auth(db_type: str) -> bool:
-    provider = _get_provider_or_none(db_type)
-    return provider.metadata.requires_auth if provider else True
+    spec = _get_spec_or_none(db_type)
+    return spec.requires_auth if spec else True
 
 
 def get_connection_display_info(config: ConnectionConfig) -> str:
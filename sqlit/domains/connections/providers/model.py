@@ -163,6 +163,11 @@ class ProviderSpec:
     display_info: Callable[[ConnectionConfig], str] | None = None
     provider_factory: Callable[[ProviderSpec], DatabaseProvider] | None = None
 
+    @property
+    def resolved_badge_label(self) -> str:
+        """Badge label, falling back to the display name and then the upper-cased db type."""
+        return self.badge_label or self.display_name or self.db_type.upper()
+
 
 @dataclass
 class DatabaseProvider:
@@ -92,6 +92,10 @@ class SQLServerAdapter(DatabaseAdapter):
 
     def __init__(self) -> None:
         self._supports_cross_database_queries_override: bool | None = None
+        # DefaultAzureCredential remembers which credential in its chain
+        # succeeded, so reusing one instance skips re-probing the others
+        # (environment, managed identity, ...) on every token refresh.
+        self._azure_credential: Any = None
 
     @property
     def name(self) -> str:
@@ -337,7 +341,9 @@ class SQLServerAdapter(DatabaseAdapter):
         prior_level = azure_logger.level
         azure_logger.setLevel(logging.ERROR)
         try:
-            access_token = DefaultAzureCredential().get_token(
+            if self._azure_credential is None:
+                self._azure_credential = DefaultAzureCredential()
+            access_token = self._azure_credential.get_token(
                 "https://database.windows.net/.default"
             )
         except ClientAuthenticationError as exc:
@@ -387,30 +393,33 @@ class SQLServerAdapter(DatabaseAdapter):
     def get_columns(
         self, conn: Any, table: str, database: str | None = None, schema: str | None = None
     ) -> list[ColumnInfo]:
-        """Get columns for a table from SQL Server."""
+        """Get columns for a table from SQL Server.
+
+        Primary-key membership is joined in so the whole listing is a
+        single round trip.
+        """
         cursor = self._get_cursor_for_database(conn, database)
         schema = schema or "dbo"
 
-        # Get primary key columns
         cursor.execute(
-            "SELECT kcu.COLUMN_NAME "
-            "FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc "
-            "JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu "
-            "  ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME "
-            "  AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA "
-            "WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY' "
-            "AND tc.TABLE_SCHEMA = ? AND tc.TABLE_NAME = ?",
-            (schema, table),
-        )
-        pk_columns = {row[0] for row in cursor.fetchall()}
-
-        # Get all columns
-        cursor.execute(
-            "SELECT COLUMN_NAME, DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS "
-            "WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ? ORDER BY ORDINAL_POSITION",
-            (schema, table),
+            "WITH pk AS ("
+            "  SELECT kcu.COLUMN_NAME "
+            "  FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc "
+            "  JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu "
+            "    ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME "
+            "    AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA "
+            "  WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY' "
+            "  AND tc.TABLE_SCHEMA = ? AND tc.TABLE_NAME = ?"
+            ") "
+            "SELECT c.COLUMN_NAME, c.DATA_TYPE, "
+            "       CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 1 ELSE 0 END "
+            "FROM INFORMATION_SCHEMA.COLUMNS c "
+            "LEFT JOIN pk ON pk.COLUMN_NAME = c.COLUMN_NAME "
+            "WHERE c.TABLE_SCHEMA = ? AND c.TABLE_NAME = ? "
+            "ORDER BY c.ORDINAL_POSITION",
+            (schema, table, schema, table),
         )
-        return [ColumnInfo(name=row[0], data_type=row[1], is_primary_key=row[0] in pk_columns) for row in cursor.fetchall()]
+        return [ColumnInfo(name=row[0], data_type=row[1], is_primary_key=row[2] == 1) for row in cursor.fetchall()]
 
     def get_procedures(self, conn: Any, database: str | None = None) -> list[str]:
         """Get stored procedures from SQL Server."""
@@ -678,11 +687,12 @@ class SQLServerAdapter(DatabaseAdapter):
                     if max_rows is not None:
                         rows = cursor.fetchmany(max_rows + 1)
                         truncated = len(rows) > max_rows
-                        rows = rows[:max_rows]
+                        if truncated:
+                            rows = rows[:max_rows]
                     else:
                         rows = cursor.fetchall()
                         truncated = False
-                    result = (columns, [tuple(row) for row in rows], truncated)
+                    result = (columns, list(map(tuple, rows)), truncated)
 
                 nextset = getattr(cursor, "nextset", None)
                 if not callable(nextset) or not nextset():
@@ -699,7 +709,7 @@ class SQLServerAdapter(DatabaseAdapter):
             else:
                 rows = cursor.fetchall()
                 truncated = False
-            return columns, [tuple(row) for row in rows], truncated
+            return columns, list(map(tuple, rows)), truncated
         return [], [], False
 
     def execute_non_query(self, conn: Any, query: str) -> int:
@@ -15,8 +15,10 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from dataclasses import dataclass
+from pathlib import Path
 
 from sqlit.shared.core.store import CONFIG_DIR
 
@@ -33,23 +35,48 @@ class CachedToken:
     expires_on: int
 
 
+# In-process copy of the last token seen, tagged with the file it belongs
+# to. A long-running TUI opens a connection per query, so this spares every
+# connect after the first a read + parse of the cache file.
+_memory: tuple[Path, CachedToken] | None = None
+_memory_lock = threading.Lock()
+
+
+def _remember(token: CachedToken | None) -> None:
+    global _memory
+    with _memory_lock:
+        _memory = (CACHE_FILE, token) if token is not None else None
+
+
+def _is_fresh(expires_on: int) -> bool:
+    return expires_on > time.time() + _REFRESH_BEFORE_EXPIRY
+
+
 def load() -> CachedToken | None:
     """Return a cached token if it exists and is comfortably non-expired."""
+    memory = _memory
+    if memory is not None and memory[0] == CACHE_FILE and _is_fresh(memory[1].expires_on):
+        return memory[1]
     try:
         data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
     except (FileNotFoundError, json.JSONDecodeError):
         return None
     expires_on = int(data.get("expires_on", 0))
-    if expires_on <= time.time() + _REFRESH_BEFORE_EXPIRY:
+    if not _is_fresh(expires_on):
         return None
     token = data.get("token")
     if not isinstance(token, str) or not token:
         return None
-    return CachedToken(token=token, expires_on=expires_on)
+    cached = CachedToken(token=token, expires_on=expires_on)
+    _remember(cached)
+    return cached
 
 
 def save(token: str, expires_on: int) -> None:
     """Persist a token atomically with 0600 perms."""
+    # Remembered first so this process keeps reusing it even if the
+    # config dir turns out to be read-only.
+    _remember(CachedToken(token=token, expires_on=int(expires_on)))
     CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
     payload = json.dumps({"token": token, "expires_on": int(expires_on)})
     tmp = CACHE_FILE.with_suffix(".tmp")
@@ -60,6 +87,7 @@ def save(token: str, expires_on: int) -> None:
 
 def clear() -> None:
     """Remove the cached token if present."""
+    _remember(None)
     try:
         CACHE_FILE.unlink()
     except FileNotFoundError:
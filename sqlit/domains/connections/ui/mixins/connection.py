@@ -506,6 +506,7 @@ class ConnectionMixin:
         except Exception:
             return
         footer.set_bindings([], [])
+        self._invalidate_footer_bindings()
 
     def _wrap_connection_result(self: ConnectionMixinHost, result: tuple | None) -> None:
         self._update_footer_bindings()
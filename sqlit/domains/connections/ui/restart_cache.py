@@ -16,7 +16,10 @@ def get_restart_cache_path() -> Path:
 def write_restart_cache(payload: dict[str, Any]) -> None:
     """Persist restart cache payload to disk (best effort)."""
     try:
-        get_restart_cache_path().write_text(json.dumps(payload), encoding="utf-8")
+        get_restart_cache_path().write_text(
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8",
+        )
     except Exception:
         # Best-effort; don't block installation due to caching failure.
         pass
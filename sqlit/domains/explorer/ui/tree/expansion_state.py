@@ -44,14 +44,24 @@ def restore_subtree_expansion_with_paths(
     host: TreeMixinHost,
     node: Any,
     expanded_paths: set[str],
+    node_path: str | None = None,
 ) -> None:
-    """Recursively expand nodes that should be expanded."""
+    """Recursively expand nodes that should be expanded.
+
+    Child paths are extended from the parent's path on the way down instead
+    of walking back up to the root for every node.
+    """
+    if node_path is None:
+        node_path = get_node_path(host, node)
     for child in node.children:
+        child_path = node_path
         if child.data:
-            path = get_node_path(host, child)
-            if path in expanded_paths:
+            path_part = host._get_node_path_part(child.data)
+            if path_part:
+                child_path = f"{node_path}/{path_part}" if node_path else path_part
+            if child_path in expanded_paths:
                 child.expand()
-        restore_subtree_expansion_with_paths(host, child, expanded_paths)
+        restore_subtree_expansion_with_paths(host, child, expanded_paths, child_path)
 
 
 def restore_subtree_expansion(host: TreeMixinHost, node: Any) -> None:
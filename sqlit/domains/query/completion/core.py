@@ -5,6 +5,7 @@ Shared logic for fuzzy matching, table extraction, keywords, and helper function
 
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -166,9 +167,9 @@ def fuzzy_match(text: str, candidates: list[str], max_results: int = 50) -> list
             # Score: 1 for fuzzy, then by first match position, then length
             results.append((1, first_match_pos * 100 + len(candidate), candidate))
 
-    # Sort by score tuple and return candidates
-    results.sort(key=lambda x: (x[0], x[1]))
-    return [r[2] for r in results[:max_results]]
+    # Only the best max_results are shown, so avoid sorting every match
+    best = heapq.nsmallest(max_results, results, key=lambda x: (x[0], x[1]))
+    return [r[2] for r in best]
 
 
 def split_identifier_parts(identifier: str) -> list[str]:
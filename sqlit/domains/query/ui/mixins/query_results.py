@@ -15,6 +15,19 @@ RESULTS_RENDER_CHUNK_SIZE = 200
 RESULTS_RENDER_INITIAL_ROWS = 20
 
 
+def _coerce_columns_to_str(rows: list[tuple], columns: set[int]) -> list[tuple]:
+    """Stringify non-null values in the given column indexes, leaving other cells untouched."""
+    indexes = sorted(columns)
+    coerced: list[tuple] = []
+    for row in rows:
+        new_row = list(row)
+        for col_idx in indexes:
+            if col_idx < len(new_row) and new_row[col_idx] is not None:
+                new_row[col_idx] = str(new_row[col_idx])
+        coerced.append(tuple(new_row))
+    return coerced
+
+
 class QueryResultsMixin:
     """Mixin providing results rendering for queries."""
 
@@ -113,8 +126,9 @@ class QueryResultsMixin:
         for row in rows:
             for idx, value in enumerate(row):
                 if isinstance(value, Decimal):
-                    digits = len(value.as_tuple().digits)
-                    exponent = value.as_tuple().exponent
+                    decimal_tuple = value.as_tuple()
+                    digits = len(decimal_tuple.digits)
+                    exponent = decimal_tuple.exponent
                     scale = -exponent if exponent < 0 else 0
                     precision = digits + (exponent if exponent > 0 else 0)
                     if precision < 1:
@@ -195,16 +209,7 @@ class QueryResultsMixin:
                 return
             batch = rows[index:end]
             if coerce_to_str_columns:
-                coerced: list[tuple] = []
-                for row in batch:
-                    new_row = []
-                    for col_idx, value in enumerate(row):
-                        if col_idx in coerce_to_str_columns and value is not None:
-                            new_row.append(str(value))
-                        else:
-                            new_row.append(value)
-                    coerced.append(tuple(new_row))
-                batch = coerced
+                batch = _coerce_columns_to_str(batch, coerce_to_str_columns)
             try:
                 table.add_rows(batch)
             except Exception as exc:
@@ -59,6 +59,12 @@ DEFAULT_KEYMAP_FILE = CONFIG_DIR / "keymap.json"
 
 _CONTEXT_ANCESTORS_CACHE: dict[str, tuple[str, ...]] | None = None
 
+# Last successfully loaded keymap, keyed by (path, name, mtime_ns, size).
+# Re-initialising against an unchanged file skips the read + parse +
+# validate pass and hands back the same provider. Only one entry is kept —
+# there is a single keymap file.
+_PARSED_KEYMAP_CACHE: dict[tuple[str, str, int, int], FileBasedKeymapProvider] = {}
+
 
 def _context_ancestors() -> dict[str, tuple[str, ...]]:
     """Walk :class:`UIStateMachine` once to build descendant→ancestors.
@@ -192,8 +198,8 @@ class FileBasedKeymapProvider(KeymapProvider):
         action_keys: list[ActionKeyDef],
     ):
         self._name = name
-        self._leader_commands = leader_commands
-        self._action_keys = action_keys
+        self._leader_commands = tuple(leader_commands)
+        self._action_keys = tuple(action_keys)
 
     @property
     def name(self) -> str:
@@ -205,6 +211,12 @@ class FileBasedKeymapProvider(KeymapProvider):
     def get_action_keys(self) -> list[ActionKeyDef]:
         return list(self._action_keys)
 
+    def _leader_command_view(self) -> tuple[LeaderCommandDef, ...]:
+        return self._leader_commands
+
+    def _action_key_view(self) -> tuple[ActionKeyDef, ...]:
+        return self._action_keys
+
 
 class KeymapManager:
     """Loads and applies a custom keymap during app startup."""
@@ -220,8 +232,9 @@ class KeymapManager:
         # loader will re-read.
         self.active_path: Path | None = None
 
-    def initialize(self) -> dict:
-        settings = self._settings_store.load_all()
+    def initialize(self, settings: dict | None = None) -> dict:
+        if settings is None:
+            settings = self._settings_store.load_all()
         self.load_custom_keymap(settings)
         return settings
 
@@ -351,6 +364,8 @@ class KeymapManager:
         self.validate_payload(payload)
         path = self.active_path or DEFAULT_KEYMAP_FILE
         path.parent.mkdir(parents=True, exist_ok=True)
+        # A same-size rewrite inside one mtime tick would look unchanged.
+        _PARSED_KEYMAP_CACHE.clear()
         path.write_text(
             json.dumps(payload, indent=2) + "\n",
             encoding="utf-8",
@@ -386,10 +401,18 @@ class KeymapManager:
 
     def _load_keymap_from_file(self, path: Path, keymap_name: str) -> FileBasedKeymapProvider:
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            stat = path.stat()
+            cache_key = (str(path), keymap_name, stat.st_mtime_ns, stat.st_size)
+            cached = _PARSED_KEYMAP_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            payload = json.loads(path.read_bytes())
         except Exception as exc:
             raise ValueError(f"Failed to read keymap JSON: {exc}") from exc
-        return self._build_provider_from_payload(payload, keymap_name)
+        keymap = self._build_provider_from_payload(payload, keymap_name)
+        _PARSED_KEYMAP_CACHE.clear()
+        _PARSED_KEYMAP_CACHE[cache_key] = keymap
+        return keymap
 
     def _build_provider_from_payload(
         self, payload: Any, keymap_name: str
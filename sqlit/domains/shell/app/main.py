@@ -7,10 +7,11 @@ import platform
 import subprocess
 import sys
 import time
+from collections import deque
 from datetime import datetime
 from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
@@ -19,6 +20,7 @@ from textual.lazy import Lazy
 from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Static, Tree
 from textual.worker import Worker
 
@@ -42,6 +44,7 @@ from sqlit.domains.shell.app.startup_flow import run_on_mount
 from sqlit.domains.shell.app.theme_manager import ThemeManager
 from sqlit.domains.shell.state import UIStateMachine
 from sqlit.domains.shell.ui.mixins.ui_navigation import UINavigationMixin
+from sqlit.domains.shell.ui.mixins.ui_status import NOTIFICATION_HISTORY_LIMIT, NotificationState
 from sqlit.shared.app import AppServices, RuntimeConfig, build_app_services
 from sqlit.shared.core.debug_events import (
     DebugEvent,
@@ -66,6 +69,9 @@ from sqlit.shared.ui.widgets_stacked_results import StackedResultsContainer
 if TYPE_CHECKING:
     from sqlit.domains.connections.app.session import ConnectionSession
 
+_WidgetT = TypeVar("_WidgetT", bound=Widget)
+_NUL = b"\0"
+
 
 class SSMSTUI(
     TreeMixin,
@@ -120,7 +126,8 @@ class SSMSTUI(
         self._debug_idle_scheduler = self.services.runtime.debug_idle_scheduler
         self._startup_profile = self.services.runtime.profile_startup
         self._startup_mark = self.services.runtime.startup_mark
-        self._startup_init_time = time.perf_counter()
+        # Only launch-time reporting (debug mode) and startup profiling read this.
+        self._startup_init_time = time.perf_counter() if self._debug_mode or self._startup_profile else 0.0
         self._startup_events: list[tuple[str, float]] = []
         self._launch_ms: float | None = None
         self._startup_stamp("init_start")
@@ -143,9 +150,6 @@ class SSMSTUI(
             "procedures": [],
         }
         self._autocomplete_visible: bool = False
-        self._autocomplete_items: list[str] = []
-        self._autocomplete_index: int = 0
-        self._autocomplete_filter: str = ""
         self._autocomplete_just_applied: bool = False
         self._suppress_autocomplete_once: bool = False
         self._value_view_active: bool = False
@@ -157,11 +161,10 @@ class SSMSTUI(
         # Undo/redo history for query editor
         self._undo_history: Any = None  # Lazy init UndoHistory
         self._fullscreen_mode: str = "none"
-        self._last_notification: str = ""
-        self._last_notification_severity: str = "information"
-        self._last_notification_time: str = ""
+        self._last_notification = NotificationState()
         self._notification_timer: Timer | None = None
-        self._notification_history: list[tuple[str, str, str]] = []
+        self._notification_history: deque[tuple[str, str, str]] = deque(maxlen=NOTIFICATION_HISTORY_LIMIT)
+        self._notification_redraw_pending = False
         self._connection_failed: bool = False
         self._leader_timer: Timer | None = None
         self._leader_pending: bool = False
@@ -215,6 +218,10 @@ class SSMSTUI(
         self._pending_result_table_info: dict[str, Any] | None = None
         self._query_target_database: str | None = None  # Target DB for auto-generated queries
         self._restart_requested: bool = False
+        # Computed lazily by restart(); restarts are rare and mount is not.
+        self._restart_argv: list[str] | None = None
+        # Compose-time widgets resolved once by selector (see _query_cached)
+        self._widget_cache: dict[str, Widget] = {}
         # Idle scheduler for background work
         self._idle_scheduler: IdleScheduler | None = None
         self._startup_stamp("init_end")
@@ -1051,57 +1058,68 @@ class SSMSTUI(
         self.notify(f"Process worker auto-shutdown {state}")
 
 
+    def _query_cached(self, selector: str, expect_type: type[_WidgetT]) -> _WidgetT:
+        """Return a compose-time widget, querying the DOM only on first use.
+
+        These widgets live for the whole app lifetime, so the selector match
+        is cached and only redone if the widget has since been detached.
+        """
+        widget = self._widget_cache.get(selector)
+        if widget is None or not widget.is_attached:
+            widget = self.query_one(selector, expect_type)
+            self._widget_cache[selector] = widget
+        return cast(_WidgetT, widget)
+
     @property
     def object_tree(self) -> Tree:
-        return self.query_one("#object-tree", Tree)
+        return self._query_cached("#object-tree", Tree)
 
     @property
     def query_input(self) -> QueryTextArea:
-        return self.query_one("#query-input", QueryTextArea)
+        return self._query_cached("#query-input", QueryTextArea)
 
     @property
     def results_table(self) -> SqlitDataTable:
         # The results table ID changes when replaced (results-table, results-table-1, etc.)
-        # Query for any DataTable within the results-area container
+        # Query for any DataTable within the results-area container. Not cached:
+        # the table is swapped out for every new result set.
         return self.query_one("#results-area DataTable")  # type: ignore[return-value]
 
     @property
-    def sidebar(self) -> Any:
-        return self.query_one("#sidebar")
+    def sidebar(self) -> Vertical:
+        return self._query_cached("#sidebar", Vertical)
 
     @property
-    def main_panel(self) -> Any:
-        return self.query_one("#main-panel")
+    def main_panel(self) -> Vertical:
+        return self._query_cached("#main-panel", Vertical)
 
     @property
-    def query_area(self) -> Any:
-        return self.query_one("#query-area")
+    def query_area(self) -> Container:
+        return self._query_cached("#query-area", Container)
 
     @property
-    def results_area(self) -> Any:
-        return self.query_one("#results-area")
+    def results_area(self) -> Container:
+        return self._query_cached("#results-area", Container)
 
     @property
     def status_bar(self) -> Static:
-        return self.query_one("#status-bar", Static)
+        return self._query_cached("#status-bar", Static)
 
     @property
     def idle_scheduler_bar(self) -> Static:
-        return self.query_one("#idle-scheduler-bar", Static)
+        return self._query_cached("#idle-scheduler-bar", Static)
 
     @property
-    def autocomplete_dropdown(self) -> Any:
-        from sqlit.shared.ui.widgets import AutocompleteDropdown
-
-        return self.query_one("#autocomplete-dropdown", AutocompleteDropdown)
+    def autocomplete_dropdown(self) -> AutocompleteDropdown:
+        return self._query_cached("#autocomplete-dropdown", AutocompleteDropdown)
 
     @property
     def tree_filter_input(self) -> TreeFilterInput:
-        return self.query_one("#tree-filter", TreeFilterInput)
+        return self._query_cached("#tree-filter", TreeFilterInput)
 
     @property
     def results_filter_input(self) -> ResultsFilterInput:
-        return self.query_one("#results-filter", ResultsFilterInput)
+        return self._query_cached("#results-filter", ResultsFilterInput)
 
     def push_screen(
         self,
@@ -1145,16 +1163,23 @@ class SSMSTUI(
 
     def _compute_restart_argv(self) -> list[str]:
         """Compute a best-effort argv to restart the app."""
-        # Linux provides the most reliable answer via /proc.
+        # Linux provides the most reliable answer via /proc. Raw fd reads
+        # avoid a buffered file object; a missing /proc just raises OSError.
+        chunks: list[bytes] = []
         try:
-            cmdline_path = "/proc/self/cmdline"
-            if os.path.exists(cmdline_path):
-                raw = open(cmdline_path, "rb").read()
-                parts = [p.decode(errors="surrogateescape") for p in raw.split(b"\0") if p]
-                if parts:
-                    return parts
-        except Exception:
+            fd = os.open("/proc/self/cmdline", os.O_RDONLY)
+            try:
+                while chunk := os.read(fd, 4096):
+                    chunks.append(chunk)
+            finally:
+                os.close(fd)
+        except OSError:
             pass
+        raw = b"".join(chunks)
+        if raw:
+            parts = [p.decode(errors="surrogateescape") for p in raw.split(_NUL) if p]
+            if parts:
+                return parts
 
         # Fallback: sys.argv (good enough for most invocations).
         argv = [sys.argv[0], *sys.argv[1:]] if sys.argv else []
@@ -1164,7 +1189,7 @@ class SSMSTUI(
 
     def restart(self) -> None:
         """Request a clean restart after the app exits."""
-        if getattr(self, "_restart_argv", None) is None:
+        if self._restart_argv is None:
             self._restart_argv = self._compute_restart_argv()
         self._restart_requested = True
         self.exit()
@@ -1223,6 +1248,10 @@ class SSMSTUI(
         if self._ui_stall_watchdog_timer is not None:
             self._ui_stall_watchdog_timer.stop()
             self._ui_stall_watchdog_timer = None
+        try:
+            self._theme_manager.flush_theme_save()
+        except Exception:
+            pass
         close_worker = getattr(self, "_close_process_worker_client", None)
         if callable(close_worker):
             close_worker()
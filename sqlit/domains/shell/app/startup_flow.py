@@ -4,21 +4,23 @@ from __future__ import annotations
 
 import json
 import sys
-import tempfile
 import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.ui.restart_cache import clear_restart_cache, get_restart_cache_path
 from sqlit.domains.explorer.ui.tree import builder as tree_builder
 from sqlit.domains.shell.app.idle_scheduler import init_idle_scheduler
 from sqlit.shared.app.startup_profiler import write_line
+from sqlit.shared.core.debug_events import emit_debug_event
 from sqlit.shared.ui.protocols import AppProtocol
 
 
 def run_on_mount(app: AppProtocol) -> None:
     """Initialize the app after mount."""
     app._startup_stamp("on_mount_start")
-    app._restart_argv = app._compute_restart_argv()
 
     is_headless = bool(getattr(app, "is_headless", False))
     if not is_headless:
@@ -35,7 +37,9 @@ def run_on_mount(app: AppProtocol) -> None:
     settings = app._theme_manager.initialize()
     app._startup_stamp("settings_loaded")
 
-    app._keymap_manager.initialize()
+    # Reuse the settings already read by the theme manager rather than
+    # parsing settings.json from disk a second time.
+    app._keymap_manager.initialize(settings)
     # Feed the (possibly user-customized) keymap into Textual so that any
     # Binding with id=<action-name> picks up the user's key.
     from sqlit.core.keymap import build_textual_keymap, get_keymap
@@ -43,7 +47,7 @@ def run_on_mount(app: AppProtocol) -> None:
     app.set_keymap(build_textual_keymap(get_keymap()))
     app._startup_stamp("keymap_loaded")
 
-    app._expanded_paths = set(settings.get("expanded_nodes", []))
+    app._expanded_paths = set(settings.get("expanded_nodes") or ())
     if settings.get("debug_events_enabled"):
         setter = getattr(app, "_set_debug_events_enabled", None)
         if callable(setter):
@@ -94,10 +98,9 @@ def run_on_mount(app: AppProtocol) -> None:
     if app.object_tree.root.children:
         app.object_tree.cursor_line = 0
     app._update_section_labels()
-    maybe_restore_connection_screen(app)
-    # Auto-connect to pending connection after driver install (if not already connecting)
-    if app._startup_connect_config is None:
-        maybe_auto_connect_pending(app)
+    # Restore a connection form or auto-connect to a pending connection
+    # after a driver-install restart.
+    schedule_restart_cache_check(app)
     app._startup_stamp("restore_checked")
     if app._debug_mode:
         app.call_after_refresh(app._record_launch_ms)
@@ -258,46 +261,80 @@ def _maybe_exit_after_refresh(app: AppProtocol) -> None:
         pass
 
 
-def _get_restart_cache_path() -> Path:
-    return Path(tempfile.gettempdir()) / "sqlit-driver-install-restore.json"
+@dataclass
+class RestartCacheRead:
+    """Raw contents and parsed payload of the driver-install restart cache."""
 
+    contents: str
+    payload: Any = None
+    error: str | None = None
 
-def maybe_auto_connect_pending(app: AppProtocol) -> bool:
-    """Auto-connect to a pending connection after driver install restart.
 
-    Returns True if a connection was initiated, False otherwise.
-    """
-    from sqlit.shared.core.debug_events import emit_debug_event
+def _read_restart_cache(cache_path: Path) -> RestartCacheRead:
+    """Read and parse the restart cache. Safe to call off the UI thread."""
+    try:
+        contents = cache_path.read_text(encoding="utf-8")
+    except OSError as exc:
+        return RestartCacheRead(contents="", error=str(exc))
+    try:
+        payload = json.loads(contents)
+    except Exception as exc:
+        return RestartCacheRead(contents=contents, error=str(exc))
+    return RestartCacheRead(contents=contents, payload=payload)
 
-    from sqlit.domains.connections.ui.restart_cache import (
-        clear_restart_cache,
-        get_restart_cache_path,
-    )
 
+def _is_form_restore(payload: Any) -> bool:
+    return isinstance(payload, dict) and payload.get("version") == 1
+
+
+def schedule_restart_cache_check(app: AppProtocol) -> None:
+    """Handle a driver-install restart cache without blocking first paint.
+
+    The common case (no cache) is a single stat on the UI thread. When a
+    cache exists it is read and parsed in a worker thread, and the result
+    is applied back on the UI thread.
+    """
     cache_path = get_restart_cache_path()
+    exists = cache_path.exists()
     emit_debug_event(
         "startup.pending_connection_check",
         cache_path=str(cache_path),
-        exists=cache_path.exists(),
+        exists=exists,
     )
-    if not cache_path.exists():
-        return False
+    if not exists:
+        return
 
-    emit_debug_event(
-        "startup.pending_connection_found",
-        contents=cache_path.read_text(),
-    )
+    # Auto-connecting to a pending connection only applies when startup
+    # isn't already connecting somewhere else.
+    auto_connect = app._startup_connect_config is None
 
-    try:
-        payload = json.loads(cache_path.read_text(encoding="utf-8"))
-    except Exception as e:
-        emit_debug_event("startup.pending_connection_parse_error", error=str(e))
+    def work() -> None:
+        read = _read_restart_cache(cache_path)
+        app.call_from_thread(_apply_restart_cache, app, read, auto_connect)
+
+    app.run_worker(work, name="restart-cache", thread=True, exclusive=False)
+
+
+def _apply_restart_cache(app: AppProtocol, read: RestartCacheRead, auto_connect: bool) -> None:
+    if read.error is not None:
+        emit_debug_event("startup.pending_connection_parse_error", error=read.error)
         clear_restart_cache()
-        return False
+        return
+
+    payload = read.payload
+    if _is_form_restore(payload):
+        clear_restart_cache()
+        _restore_connection_screen(app, payload)
+        return
 
-    # Always clear cache after reading
+    if not auto_connect:
+        return
+    emit_debug_event("startup.pending_connection_found", contents=read.contents)
     clear_restart_cache()
+    _connect_pending_payload(app, payload)
 
+
+def _connect_pending_payload(app: AppProtocol, payload: Any) -> bool:
     # Check for version 2 pending_connection type
     if not isinstance(payload, dict):
         emit_debug_event("startup.pending_connection_invalid", reason="not a dict")
@@ -339,31 +376,7 @@ def maybe_auto_connect_pending(app: AppProtocol) -> bool:
     return True
 
 
-def maybe_restore_connection_screen(app: AppProtocol) -> None:
-    """Restore an in-progress connection form after a driver-install restart."""
-    cache_path = _get_restart_cache_path()
-    if not cache_path.exists():
-        return
-
-    try:
-        payload = json.loads(cache_path.read_text(encoding="utf-8"))
-    except Exception:
-        try:
-            cache_path.unlink(missing_ok=True)
-        except Exception:
-            pass
-        return
-
-    # Only handle version 1 (connection form restore), leave version 2 for maybe_auto_connect_pending
-    if not isinstance(payload, dict) or payload.get("version") != 1:
-        return
-
-    # Clear cache only for version 1
-    try:
-        cache_path.unlink(missing_ok=True)
-    except Exception:
-        pass
-
+def _restore_connection_screen(app: AppProtocol, payload: dict[str, Any]) -> None:
     values = payload.get("values")
     if not isinstance(values, dict):
         return
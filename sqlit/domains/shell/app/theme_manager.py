@@ -35,6 +35,9 @@ from .themes import (
 )
 
 CUSTOM_THEME_SETTINGS_KEY = "custom_themes"
+# Delay before persisting a theme change, so browsing themes in the picker
+# collapses into a single settings write.
+THEME_SAVE_DEBOUNCE_S = 0.25
 CUSTOM_THEME_DIR = CONFIG_DIR / "themes"
 CUSTOM_THEME_FIELDS = {
     "name",
@@ -79,6 +82,15 @@ class ThemeAppProtocol(Protocol):
         pause: bool = False,
     ) -> Any: ...
 
+    def set_timer(
+        self,
+        delay: float,
+        callback: Any,
+        *,
+        name: str | None = None,
+        pause: bool = False,
+    ) -> Any: ...
+
     def notify(
         self,
         message: str,
@@ -109,6 +121,8 @@ class ThemeManager:
         self._light_theme_names: set[str] = set(LIGHT_THEME_NAMES)
         self._omarchy_theme_watcher: Timer | None = None
         self._omarchy_last_theme_name: str | None = None
+        self._theme_save_timer: Timer | None = None
+        self._pending_theme: str | None = None
 
     def register_builtin_themes(self) -> None:
         for theme in SQLIT_THEMES:
@@ -126,10 +140,30 @@ class ThemeManager:
         return settings
 
     def on_theme_changed(self, new_theme: str) -> None:
+        self._pending_theme = new_theme
+        if self._theme_save_timer is not None:
+            self._theme_save_timer.stop()
+        try:
+            self._theme_save_timer = self._app.set_timer(
+                THEME_SAVE_DEBOUNCE_S, self.flush_theme_save, name="theme-save"
+            )
+        except Exception:
+            self._theme_save_timer = None
+            self.flush_theme_save()
+        self.apply_textarea_theme(new_theme)
+
+    def flush_theme_save(self) -> None:
+        """Persist the most recent theme change, if one is still pending."""
+        if self._theme_save_timer is not None:
+            self._theme_save_timer.stop()
+            self._theme_save_timer = None
+        theme_name = self._pending_theme
+        if theme_name is None:
+            return
+        self._pending_theme = None
         settings = self._settings_store.load_all()
-        settings["theme"] = new_theme
+        settings["theme"] = theme_name
         self._settings_store.save_all(settings)
-        self.apply_textarea_theme(new_theme)
 
     def apply_omarchy_theme(self) -> None:
         matched_theme = get_matching_textual_theme(set(self._app.available_themes))
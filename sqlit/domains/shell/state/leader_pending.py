@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from sqlit.core.input_context import InputContext
-from sqlit.core.leader_commands import get_leader_binding_actions, get_leader_commands
+from sqlit.core.leader_commands import get_leader_commands_by_action
 from sqlit.core.state_base import ActionResult, DisplayBinding, State
 
 
@@ -14,15 +14,9 @@ class LeaderPendingState(State):
         pass
 
     def check_action(self, app: InputContext, action_name: str) -> ActionResult:
-        menu = app.leader_menu
-        leader_binding_actions = get_leader_binding_actions(menu)
-        if action_name in leader_binding_actions:
-            leader_commands = get_leader_commands(menu)
-            cmd = next((c for c in leader_commands if c.binding_action == action_name), None)
-            if cmd and cmd.is_allowed(app):
-                return ActionResult.ALLOWED
-            return ActionResult.FORBIDDEN
-
+        cmd = get_leader_commands_by_action(app.leader_menu).get(action_name)
+        if cmd and cmd.is_allowed(app):
+            return ActionResult.ALLOWED
         return ActionResult.FORBIDDEN
 
     def get_display_bindings(self, app: InputContext) -> tuple[list[DisplayBinding], list[DisplayBinding]]:
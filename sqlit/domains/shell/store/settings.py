@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 from typing import Any
@@ -27,6 +28,25 @@ class SettingsStore(JSONFileStore):
 
     def __init__(self, file_path: Path | None = None) -> None:
         super().__init__(file_path or _resolve_settings_path())
+        # Raw file bytes and the stamp they were read at, so repeated
+        # load_all() calls skip re-reading an unchanged file. Parsing the
+        # bytes again hands each caller its own dict more cheaply than a
+        # deepcopy of a parsed one.
+        self._cached_stamp: tuple[int, int, int] | None = None
+        self._cached_raw: bytes = b""
+
+    def _read_raw(self) -> bytes:
+        try:
+            return self._file_path.read_bytes()
+        except OSError:
+            return b""
+
+    def _file_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self._file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
     @classmethod
     def get_instance(cls) -> SettingsStore:
@@ -43,7 +63,16 @@ class SettingsStore(JSONFileStore):
         Returns:
             Dictionary of settings, or empty dict if none exist.
         """
-        data = self._read_json()
+        stamp = self._file_stamp()
+        if stamp is None or stamp != self._cached_stamp:
+            self._cached_raw = self._read_raw() if stamp is not None else b""
+            self._cached_stamp = stamp
+        if not self._cached_raw:
+            return {}
+        try:
+            data = json.loads(self._cached_raw)
+        except ValueError:
+            return {}
         return data if isinstance(data, dict) else {}
 
     def save_all(self, settings: dict[str, Any]) -> None:
@@ -52,6 +81,7 @@ class SettingsStore(JSONFileStore):
         Args:
             settings: Dictionary of settings to save.
         """
+        self._cached_stamp = None
         self._write_json(settings)
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from textual.timer import Timer
@@ -14,6 +15,17 @@ from .ui_status import UIStatusMixin
 if TYPE_CHECKING:
     pass
 
+# Screen class applied for each fullscreen mode; the layout overrides
+# themselves (display/height/width) live in main.css.
+_FULLSCREEN_CLASSES = MappingProxyType(
+    {
+        "none": None,
+        "explorer": "explorer-fullscreen",
+        "query": "query-fullscreen",
+        "results": "results-fullscreen",
+    }
+)
+
 
 class UINavigationMixin(UIStatusMixin, UILeaderMixin):
     """Mixin providing UI navigation and vim mode functionality."""
@@ -25,16 +37,22 @@ class UINavigationMixin(UIStatusMixin, UILeaderMixin):
     def _set_fullscreen_mode(self: UINavigationMixinHost, mode: str) -> None:
         """Set fullscreen mode: none|explorer|query|results."""
         self._fullscreen_mode = mode
-        self.screen.remove_class("results-fullscreen")
-        self.screen.remove_class("query-fullscreen")
-        self.screen.remove_class("explorer-fullscreen")
-
-        if mode == "results":
-            self.screen.add_class("results-fullscreen")
-        elif mode == "query":
-            self.screen.add_class("query-fullscreen")
-        elif mode == "explorer":
-            self.screen.add_class("explorer-fullscreen")
+        target = _FULLSCREEN_CLASSES.get(mode)
+        screen = self.screen
+        stale = [
+            name
+            for name in _FULLSCREEN_CLASSES.values()
+            if name is not None and name != target and screen.has_class(name)
+        ]
+        missing = [target] if target is not None and not screen.has_class(target) else []
+        if not stale and not missing:
+            return
+        # Apply the swap as a single restyle instead of one per class change.
+        if stale:
+            screen.remove_class(*stale, update=False)
+        if missing:
+            screen.add_class(*missing, update=False)
+        screen.update_node_styles()
 
     def action_focus_explorer(self: UINavigationMixinHost) -> None:
         """Focus the Explorer pane."""
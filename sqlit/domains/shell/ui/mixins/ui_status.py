@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass
 from typing import Any
 
 from sqlit.domains.connections.providers.metadata import get_connection_display_info
 from sqlit.shared.ui.protocols import UINavigationMixinHost
 
+# Notifications kept for the session; older entries are dropped.
+NOTIFICATION_HISTORY_LIMIT = 200
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationState:
+    """Notification currently shown in the status bar."""
+
+    message: str = ""
+    severity: str = "information"
+    timestamp: str = ""
+
 
 class UIStatusMixin:
     """Mixin providing status bar and footer updates."""
 
     _notification_timer: Any | None = None
-    _last_notification: str = ""
-    _last_notification_severity: str = "information"
-    _last_notification_time: str = ""
-    _notification_history: list[tuple[str, str, str]] = []
+    _last_notification: NotificationState = NotificationState()
+    _notification_history: deque[tuple[str, str, str]] = deque(maxlen=NOTIFICATION_HISTORY_LIMIT)
     _last_active_pane: str | None = None
+    _footer_bindings_signature: tuple[Any, ...] | None = None
+    _notification_redraw_pending: bool = False
+
     def _update_section_labels(self: UINavigationMixinHost) -> None:
         """Update section labels to highlight the active pane."""
         try:
@@ -242,9 +257,10 @@ class UIStatusMixin:
 
         left_content = f"{status_str}{mode_str}{conn_info}"
 
-        notification = getattr(self, "_last_notification", "")
-        timestamp = getattr(self, "_last_notification_time", "")
-        severity = getattr(self, "_last_notification_severity", "information")
+        last_notification = self._last_notification
+        notification = last_notification.message
+        timestamp = last_notification.timestamp
+        severity = last_notification.severity
         launch_ms = getattr(self, "_launch_ms", None)
         show_launch = (
             getattr(self, "_debug_mode", False)
@@ -407,19 +423,31 @@ class UIStatusMixin:
 
         if severity == "error":
             # Clear any status bar notification and show error in results
-            self._last_notification = ""
-            self._last_notification_severity = "information"
-            self._last_notification_time = ""
+            self._last_notification = NotificationState()
             self._update_status_bar()
             self._show_error_in_results(message, timestamp)
             self._show_error_dialog(message, title=title)
         else:
             # Show normal/warning in status bar
-            self._last_notification = message
-            self._last_notification_severity = severity
-            self._last_notification_time = timestamp
+            self._last_notification = NotificationState(message, severity, timestamp)
+            self._schedule_notification_redraw()
+
+    def _schedule_notification_redraw(self: UINavigationMixinHost) -> None:
+        """Redraw the status bar once for a burst of notifications.
+
+        Only the latest notification is visible, so repeated notify() calls
+        before the next message-loop turn share a single status bar update.
+        """
+        if self._notification_redraw_pending:
+            return
+        self._notification_redraw_pending = True
+
+        def redraw() -> None:
+            self._notification_redraw_pending = False
             self._update_status_bar()
 
+        self.call_later(redraw)
+
     def _show_error_dialog(self: UINavigationMixinHost, message: str, *, title: str = "") -> None:
         """Display an error dialog for critical errors."""
         from textual.screen import ModalScreen
@@ -448,6 +476,10 @@ class UIStatusMixin:
         self._replace_results_table(["Error"], [(error_text,)])
         self._update_footer_bindings()
 
+    def _invalidate_footer_bindings(self: UINavigationMixinHost) -> None:
+        """Force the next footer update to rebuild after the footer was changed elsewhere."""
+        self._footer_bindings_signature = None
+
     def _update_footer_bindings(self: UINavigationMixinHost) -> None:
         """Update footer with context-appropriate bindings from the state machine."""
         from sqlit.shared.ui.widgets import ContextFooter, KeyBinding
@@ -463,6 +495,15 @@ class UIStatusMixin:
         else:
             return
 
+        # Screen pushes/pops and many editor actions request a footer refresh
+        # without changing anything the footer renders; skip the rebuild then.
+        from sqlit.core.keymap import get_keymap
+
+        signature = (footer, ctx, get_keymap(), self.theme)
+        if signature == self._footer_bindings_signature:
+            return
+        self._footer_bindings_signature = signature
+
         left_display, right_display = self._state_machine.get_display_bindings(ctx)
 
         left_bindings = [KeyBinding(b.key, b.label, b.action) for b in left_display]
@@ -10,7 +10,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Static
 
 from sqlit.core.keymap import format_key
-from sqlit.core.leader_commands import get_leader_commands
+from sqlit.core.leader_commands import get_leader_commands, get_leader_commands_by_action
 from sqlit.shared.ui.widgets import Dialog
 
 if TYPE_CHECKING:
@@ -47,7 +47,7 @@ class LeaderMenuScreen(ModalScreen):
         super().__init__()
         self._menu = menu
         leader_commands = get_leader_commands(menu)
-        self._cmd_actions = {cmd.binding_action: cmd for cmd in leader_commands}
+        self._cmd_actions = get_leader_commands_by_action(menu)
         self._cmd_by_key = {cmd.key: cmd for cmd in leader_commands}
 
         for cmd in leader_commands:
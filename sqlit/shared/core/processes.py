@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 import subprocess
 from dataclasses import dataclass, field
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 @runtime_checkable
@@ -112,6 +114,8 @@ class AsyncSubprocessRunner(AsyncProcessRunner):
     """Default async runner using asyncio subprocess shell."""
 
     async def spawn(self, command: str) -> AsyncProcess:
+        import asyncio
+
         return await asyncio.create_subprocess_shell(
             command,
             stdout=asyncio.subprocess.PIPE,
@@ -139,6 +143,8 @@ class FixedResultAsyncRunner(AsyncProcessRunner):
     lines: list[str] = field(default_factory=list)
 
     async def spawn(self, command: str) -> AsyncProcess:
+        import asyncio
+
         reader = asyncio.StreamReader()
         for line in self.lines:
             reader.feed_data((line + "\n").encode("utf-8"))
@@ -70,11 +70,15 @@ class SystemProbe:
         )
         self._sysconfig_paths = dict(sysconfig_paths) if sysconfig_paths is not None else _safe_sysconfig_paths()
         self._stdlib_paths = list(stdlib_paths) if stdlib_paths is not None else _safe_stdlib_paths()
-        self._pip_available = (
-            bool(pip_available) if pip_available is not None else importlib.util.find_spec("pip") is not None
-        )
-        self._os_release_content = os_release_content if os_release_content is not None else _read_os_release()
+        # Resolved on first use: find_spec walks sys.path, and most probes
+        # never get asked about pip.
+        self._pip_available = bool(pip_available) if pip_available is not None else None
+        self._os_release_content = os_release_content
+        self._os_release_loaded = os_release_content is not None
         self._path_writable = path_writable or (lambda path: os.access(path, os.W_OK))
+        # Filesystem-backed answers, computed once per snapshot.
+        self._externally_managed: bool | None = None
+        self._paths_writable: bool | None = None
 
     @property
     def executable(self) -> str:
@@ -119,21 +123,24 @@ class SystemProbe:
         return bool(self._conda_prefix)
 
     def pep668_externally_managed(self) -> bool:
-        if self.in_venv():
-            return False
-        for stdlib_path in self._stdlib_paths:
-            marker = Path(stdlib_path) / "EXTERNALLY-MANAGED"
-            if marker.exists():
-                return True
-        return False
+        if self._externally_managed is None:
+            self._externally_managed = not self.in_venv() and any(
+                (Path(stdlib_path) / "EXTERNALLY-MANAGED").exists() for stdlib_path in self._stdlib_paths
+            )
+        return self._externally_managed
 
     def pip_available(self) -> bool:
+        if self._pip_available is None:
+            self._pip_available = importlib.util.find_spec("pip") is not None
         return self._pip_available
 
     def user_site_enabled(self) -> bool:
         return self._user_site_enabled
 
     def is_arch_linux(self) -> bool:
+        if not self._os_release_loaded:
+            self._os_release_content = _read_os_release()
+            self._os_release_loaded = True
         content = (self._os_release_content or "").lower()
         return "arch" in content or "manjaro" in content or "endeavouros" in content
 
@@ -141,6 +148,11 @@ class SystemProbe:
         return None
 
     def install_paths_writable(self) -> bool:
+        if self._paths_writable is None:
+            self._paths_writable = self._check_install_paths_writable()
+        return self._paths_writable
+
+    def _check_install_paths_writable(self) -> bool:
         for key in ("purelib", "platlib"):
             value = self._sysconfig_paths.get(key)
             if not value:
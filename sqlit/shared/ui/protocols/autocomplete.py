@@ -29,7 +29,6 @@ class SchemaCacheStateProtocol(Protocol):
 
 
 class AutocompleteStateProtocol(Protocol):
-    _autocomplete_filter: str
     _autocomplete_just_applied: bool
     _autocomplete_visible: bool
     _suppress_autocomplete_on_newline: bool
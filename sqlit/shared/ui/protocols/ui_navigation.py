@@ -5,23 +5,26 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from collections import deque
+
     from textual.timer import Timer
     from textual.widgets import Static
 
     from sqlit.core.input_context import InputContext
+    from sqlit.domains.shell.ui.mixins.ui_status import NotificationState
 
 
 class UIStateProtocol(Protocol):
     _fullscreen_mode: str
-    _last_notification: str
-    _last_notification_severity: str
-    _last_notification_time: str
+    _last_notification: NotificationState
     _notification_timer: Timer | None
-    _notification_history: list[tuple[str, str, str]]
+    _notification_history: deque[tuple[str, str, str]]
+    _notification_redraw_pending: bool
     _leader_timer: Timer | None
     _leader_pending: bool
     _leader_pending_menu: str
     _last_active_pane: str | None
+    _footer_bindings_signature: tuple[Any, ...] | None
     _state_machine: Any
     _active_database: str | None
     _query_target_database: str | None
@@ -35,9 +38,15 @@ class UINavigationActionsProtocol(Protocol):
     def _update_status_bar(self) -> None:
         ...
 
+    def _schedule_notification_redraw(self) -> None:
+        ...
+
     def _update_footer_bindings(self) -> None:
         ...
 
+    def _invalidate_footer_bindings(self) -> None:
+        ...
+
     def _set_fullscreen_mode(self, mode: str) -> None:
         ...
 
@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from textual.containers import Container
     from textual.widgets import Static, TextArea, Tree
 
-    from sqlit.shared.ui.widgets import SqlitDataTable
+    from sqlit.shared.ui.widgets import AutocompleteDropdown, SqlitDataTable
 
 
 class WidgetAccessProtocol(Protocol):
@@ -28,7 +29,7 @@ class WidgetAccessProtocol(Protocol):
         ...
 
     @property
-    def autocomplete_dropdown(self) -> Any:
+    def autocomplete_dropdown(self) -> AutocompleteDropdown:
         ...
 
     @property
@@ -40,5 +41,5 @@ class WidgetAccessProtocol(Protocol):
         ...
 
     @property
-    def results_area(self) -> Any:
+    def results_area(self) -> Container:
         ...
@@ -143,3 +143,14 @@ def test_cli_version_short_option(tmp_path: Path):
     )
     assert result.returncode == 0
     assert "sqlit" in result.stdout
+
+
+def test_provider_parsers_only_built_for_provider_commands():
+    from sqlit.cli import _needs_provider_parsers
+
+    assert _needs_provider_parsers(["connect", "postgresql", "--server", "db"])
+    assert _needs_provider_parsers(["--mock", "empty", "connections", "add", "sqlite"])
+    assert _needs_provider_parsers(["connection", "list"])
+    assert not _needs_provider_parsers([])
+    assert not _needs_provider_parsers(["--theme", "nord"])
+    assert not _needs_provider_parsers(["query", "-c", "prod", "-q", "select 1"])
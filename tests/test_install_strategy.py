@@ -55,3 +55,40 @@ def test_detect_strategy_pip_user_fallback(tmp_path):
     assert strategy.can_auto_install is True
     assert "--user" in (strategy.auto_install_command or [])
     assert (strategy.auto_install_command or [])[-1] == "sqlit-tui[postgres]"
+
+
+def test_system_probe_resolves_pip_lazily(monkeypatch):
+    import importlib.util
+
+    calls: list[str] = []
+
+    def fake_find_spec(name, *args, **kwargs):
+        calls.append(name)
+        return object()
+
+    monkeypatch.setattr(importlib.util, "find_spec", fake_find_spec)
+    probe = SystemProbe(env={"_SQLIT_TEST": "1"}, os_release_content="")
+    assert calls == []
+
+    assert probe.pip_available() is True
+    assert probe.pip_available() is True
+    assert calls == ["pip"]
+
+
+def test_system_probe_checks_install_paths_once(tmp_path):
+    checked: list[object] = []
+
+    def path_writable(path):
+        checked.append(path)
+        return True
+
+    probe = SystemProbe(
+        env={"_SQLIT_TEST": "1"},
+        os_release_content="",
+        sysconfig_paths={"purelib": str(tmp_path)},
+        path_writable=path_writable,
+    )
+
+    assert probe.install_paths_writable() is True
+    assert probe.install_paths_writable() is True
+    assert len(checked) == 1
@@ -57,3 +57,27 @@ class TestCatalogConsistency:
         for db_type in get_supported_db_types():
             schema = get_connection_schema(db_type)
             assert schema.display_name == get_display_name(db_type)
+
+    def test_metadata_accessors_match_provider_metadata(self):
+        from sqlit.domains.connections.providers.catalog import get_provider
+        from sqlit.domains.connections.providers.registry import get_badge_label, requires_auth
+
+        for db_type in get_supported_db_types():
+            metadata = get_provider(db_type).metadata
+            assert get_display_name(db_type) == metadata.display_name
+            assert get_badge_label(db_type) == metadata.badge_label
+            assert get_default_port(db_type) == metadata.default_port
+            assert supports_ssh(db_type) == metadata.supports_ssh
+            assert is_file_based(db_type) == metadata.is_file_based
+            assert has_advanced_auth(db_type) == metadata.has_advanced_auth
+            assert requires_auth(db_type) == metadata.requires_auth
+
+    def test_badge_label_falls_back_to_display_name_then_db_type(self):
+        from sqlit.domains.connections.providers.model import ProviderSpec
+
+        def spec(**kwargs):
+            return ProviderSpec(db_type="foo", schema_path=("m", "S"), **kwargs)
+
+        assert spec(display_name="Foo DB", badge_label="FOO").resolved_badge_label == "FOO"
+        assert spec(display_name="Foo DB").resolved_badge_label == "Foo DB"
+        assert spec(display_name="").resolved_badge_label == "FOO"
@@ -363,3 +363,22 @@ def test_refresh_restores_cursor_to_column_after_reload() -> None:
     column_after = _find_column(host.object_tree.root, "id")
     assert column_after is not None
     assert host.object_tree.cursor_node is column_after
+
+
+def test_restore_subtree_expansion_matches_full_node_paths() -> None:
+    host = MockHost()
+    connection = host.object_tree.root.add("Local")
+    connection.data = ConnectionNode(config=host.current_config)
+    tables = connection.add("Tables")
+    tables.data = FolderNode(folder_type="tables")
+    users = tables.add("users")
+    users.data = TableNode(database=None, schema="public", name="users")
+    orders = tables.add("orders")
+    orders.data = TableNode(database=None, schema="public", name="orders")
+
+    expanded = {expansion_state.get_node_path(host, node) for node in (tables, orders)}
+    expansion_state.restore_subtree_expansion_with_paths(host, connection, expanded)
+
+    assert tables.is_expanded
+    assert orders.is_expanded
+    assert not users.is_expanded
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from sqlit.core.keymap import get_keymap, reset_keymap
+from sqlit.core.keymap import ActionKeyDef, LeaderCommandDef, get_keymap, reset_keymap
 from sqlit.domains.shell.app.keymap_manager import FileBasedKeymapProvider, KeymapManager
 
 
@@ -79,6 +79,21 @@ class TestLifecycle:
         assert manager.load_error is None
         assert get_keymap().action("enter_insert_mode") == "i"
 
+    def test_initialize_reuses_provided_settings(self):
+        # Startup hands over the dict the theme manager already read, so
+        # the store must not be consulted a second time.
+        class CountingStore(MockSettingsStore):
+            loads = 0
+
+            def load_all(self) -> dict:
+                CountingStore.loads += 1
+                return super().load_all()
+
+        settings = {"theme": "sqlit"}
+        manager = KeymapManager(settings_store=CountingStore({}))
+        assert manager.initialize(settings) is settings
+        assert CountingStore.loads == 0
+
     def test_scaffold_created_on_first_run(self):
         # The autouse fixture redirected DEFAULT_KEYMAP_FILE to a fresh tmp dir.
         from sqlit.domains.shell.app import keymap_manager as km_mod
@@ -112,6 +127,44 @@ class TestLifecycle:
         manager.initialize()
         assert manager.load_error is None
 
+    def test_utf8_bom_keymap_loads(self):
+        # Some Windows editors prepend a BOM when saving UTF-8.
+        from sqlit.domains.shell.app import keymap_manager as km_mod
+        km_mod.DEFAULT_KEYMAP_FILE.write_bytes(
+            b"\xef\xbb\xbf"
+            + json.dumps(
+                {"keymap": {"action_keys": {"query_normal": {"enter_insert_mode": "f7"}}}}
+            ).encode("utf-8")
+        )
+        manager = KeymapManager(settings_store=MockSettingsStore({}))
+        manager.initialize()
+        assert manager.load_error is None
+        assert get_keymap().action("enter_insert_mode") == "f7"
+
+    def test_unchanged_file_reuses_parsed_keymap(self):
+        from sqlit.domains.shell.app import keymap_manager as km_mod
+        _write(
+            km_mod.DEFAULT_KEYMAP_FILE,
+            {"keymap": {"action_keys": {"query_normal": {"enter_insert_mode": "f7"}}}},
+        )
+        manager = KeymapManager(settings_store=MockSettingsStore({}))
+        manager.initialize()
+        first = get_keymap()
+        assert isinstance(first, FileBasedKeymapProvider)
+        manager.initialize()
+        assert get_keymap() is first
+
+    def test_edit_reparses_keymap_file(self):
+        from sqlit.domains.shell.app import keymap_manager as km_mod
+        manager = KeymapManager(settings_store=MockSettingsStore({}))
+        manager.initialize()
+        manager.edit_action_key("query_normal", "enter_insert_mode", "f7")
+        assert get_keymap().action("enter_insert_mode") == "f7"
+        # Same size, likely the same mtime tick — must still be re-read.
+        manager.edit_action_key("query_normal", "enter_insert_mode", "f8")
+        assert get_keymap().action("enter_insert_mode") == "f8"
+        assert km_mod.DEFAULT_KEYMAP_FILE.exists()
+
 
 class TestSimpleRemap:
     """Remapping a single key for an existing (state, action) pair."""
@@ -576,3 +629,31 @@ class TestMetadataInheritance:
         assert match.key == "comma"
         assert match.primary is True
         assert match.priority is True
+
+
+class TestProviderLookups:
+    def test_lookups_do_not_copy_bindings(self, monkeypatch):
+        provider = FileBasedKeymapProvider(
+            "lookups",
+            [LeaderCommandDef("x", "quit", "Quit", "Actions")],
+            [
+                ActionKeyDef("ctrl+a", "select_all", "query_insert"),
+                ActionKeyDef("cmd+a", "select_all", "query_insert", primary=False),
+            ],
+        )
+
+        def fail() -> None:
+            raise AssertionError("lookup copied the binding list")
+
+        monkeypatch.setattr(provider, "get_leader_commands", fail)
+        monkeypatch.setattr(provider, "get_action_keys", fail)
+        assert provider.leader("quit") == "x"
+        assert provider.action("select_all") == "ctrl+a"
+        assert provider.keys_for_action("select_all") == ["ctrl+a", "cmd+a"]
+        assert provider.actions_for_key("cmd+a") == ["select_all"]
+
+    def test_getters_return_fresh_lists(self):
+        provider = FileBasedKeymapProvider("fresh", [], [ActionKeyDef("a", "x")])
+        keys = provider.get_action_keys()
+        keys.clear()
+        assert len(provider.get_action_keys()) == 1
@@ -70,6 +70,16 @@ class TestKeymapProvider:
         assert leader_commands[0].key == "z"
         assert leader_commands[0].action == "quit"
 
+    def test_leader_commands_cached_per_provider(self):
+        """Leader commands are built once per provider and rebuilt on swap."""
+        first = MockKeymapProvider(leader_commands=[LeaderCommandDef("z", "quit", "Exit", "Actions")])
+        set_keymap(first)
+        assert get_leader_commands() is get_leader_commands()
+
+        second = MockKeymapProvider(leader_commands=[LeaderCommandDef("y", "quit", "Exit", "Actions")])
+        set_keymap(second)
+        assert [cmd.key for cmd in get_leader_commands()] == ["y"]
+
     def test_reset_keymap_restores_default(self):
         """reset_keymap() should restore the default keymap."""
         default_quit_key = get_keymap().leader("quit")
@@ -84,3 +94,32 @@ class TestKeymapProvider:
 
         reset_keymap()
         assert get_keymap().leader("quit") == default_quit_key
+
+    def test_leader_commands_by_action_follow_keymap(self):
+        """The binding-action index is rebuilt when the provider changes."""
+        from sqlit.core.leader_commands import get_leader_commands_by_action
+
+        set_keymap(MockKeymapProvider(leader_commands=[LeaderCommandDef("z", "quit", "Exit", "Actions")]))
+        assert get_leader_commands_by_action()["leader_quit"].key == "z"
+
+        set_keymap(MockKeymapProvider(leader_commands=[LeaderCommandDef("y", "quit", "Exit", "Actions")]))
+        assert get_leader_commands_by_action()["leader_quit"].key == "y"
+
+    def test_leader_commands_by_key_keep_keymap_order(self):
+        """Commands sharing a key stay in keymap order so the first allowed one wins."""
+        from sqlit.core.leader_commands import get_leader_commands_by_key
+
+        set_keymap(
+            MockKeymapProvider(
+                leader_commands=[
+                    LeaderCommandDef("c", "disconnect", "Disconnect", "Connection", guard="has_connection"),
+                    LeaderCommandDef("c", "show_connection_picker", "Connect", "Connection"),
+                    LeaderCommandDef("q", "quit", "Quit", "Actions"),
+                ],
+            )
+        )
+
+        by_key = get_leader_commands_by_key()
+        assert [cmd.action for cmd in by_key["c"]] == ["disconnect", "show_connection_picker"]
+        assert [cmd.action for cmd in by_key["q"]] == ["quit"]
+        assert "x" not in by_key
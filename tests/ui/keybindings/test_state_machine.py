@@ -245,3 +245,24 @@ class TestEditQueryInEditorLeaderCommand:
             leader_menu="leader",
         )
         assert sm.check_action(ctx, "leader_edit_query_in_editor") is True
+
+
+class TestActionResolutionCache:
+    """Cached parent-chain resolution must still honour per-context guards."""
+
+    def test_inherited_guard_reevaluated_per_context(self):
+        sm = UIStateMachine()
+
+        assert sm.check_action(make_context(query_executing=False), "cancel_operation") is False
+        assert sm.check_action(make_context(query_executing=True), "cancel_operation") is True
+        assert sm.check_action(make_context(query_executing=False), "cancel_operation") is False
+
+    def test_forbids_after_lookup_invalidates_resolution(self):
+        sm = UIStateMachine()
+        ctx = make_context(query_executing=True)
+        assert sm.check_action(ctx, "cancel_operation") is True
+
+        state = sm.get_active_state(ctx)
+        state.forbids("cancel_operation")
+
+        assert sm.check_action(ctx, "cancel_operation") is False
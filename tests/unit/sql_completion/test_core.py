@@ -70,6 +70,18 @@ class TestFuzzyMatch:
         assert result[0] in ["ab_cd", "abcd"]
         assert result[1] in ["ab_cd", "abcd"]
 
+    def test_fuzzy_ranked_by_first_match_then_input_order(self):
+        """Earlier first-character matches rank higher; ties keep input order."""
+        candidates = ["xx_u_s", "x_us", "x_u_s", "the[u]s"]
+        result = fuzzy_match("us", candidates, max_results=3)
+        assert result == ["x_us", "x_u_s", "xx_u_s"]
+
+    def test_regex_metacharacters_match_literally(self):
+        """Typed punctuation is matched as plain characters."""
+        candidates = ["a.b", "axb", "[x]", "x"]
+        assert fuzzy_match(".", candidates) == ["a.b"]
+        assert fuzzy_match("[]", candidates) == ["[x]"]
+
 
 class TestExtractTableRefs:
     """Tests for table reference extraction."""
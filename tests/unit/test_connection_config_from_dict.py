@@ -70,6 +70,14 @@ def test_from_dict_folder_path_normalized() -> None:
     assert config.folder_path == "Potato/Ninja"
 
 
+def test_from_dict_shares_db_type_string() -> None:
+    first = ConnectionConfig.from_dict({"name": "a", "db_type": "".join(["post", "gresql"])})
+    second = ConnectionConfig.from_dict({"name": "b", "db_type": "".join(["postgre", "sql"])})
+
+    assert first.db_type == "postgresql"
+    assert first.db_type is second.db_type
+
+
 def test_from_dict_endpoint_password_command() -> None:
     data = {
         "name": "pc-test",
@@ -0,0 +1,35 @@
+"""Unit tests for IBM Db2 adapter introspection."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from sqlit.domains.connections.providers.db2.adapter import Db2Adapter
+
+
+class TestDb2GetColumns:
+    def test_primary_key_resolved_in_single_query(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [("ID", "INTEGER", 1), ("NAME", "VARCHAR", 0)]
+
+        columns = Db2Adapter().get_columns(conn, "users", schema="app")
+
+        assert cursor.execute.call_count == 1
+        assert cursor.execute.call_args.args[1] == ("APP", "USERS")
+        assert [(c.name, c.data_type, c.is_primary_key) for c in columns] == [
+            ("ID", "INTEGER", True),
+            ("NAME", "VARCHAR", False),
+        ]
+
+    def test_resolves_current_schema_when_unqualified(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchone.return_value = ("DB2INST1",)
+        cursor.fetchall.return_value = [("ID", "INTEGER", 1)]
+
+        columns = Db2Adapter().get_columns(conn, "users")
+
+        assert cursor.execute.call_count == 2
+        assert cursor.execute.call_args.args[1] == ("DB2INST1", "USERS")
+        assert [c.is_primary_key for c in columns] == [True]
@@ -0,0 +1,72 @@
+"""Unit tests for Firebird adapter introspection."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from sqlit.domains.connections.providers.firebird.adapter import FirebirdAdapter
+
+
+def _conn_with_rows(rows: list[tuple]) -> tuple[MagicMock, MagicMock]:
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    cursor.fetchall.return_value = rows
+    return conn, cursor
+
+
+class TestFirebirdGetColumns:
+    def test_primary_key_resolved_in_single_query(self):
+        conn, cursor = _conn_with_rows(
+            [
+                ("ID                 ", 8, None, 0, "ID                 "),
+                ("NAME               ", 37, 50, 0, None),
+            ]
+        )
+
+        columns = FirebirdAdapter().get_columns(conn, "users")
+
+        assert cursor.execute.call_count == 1
+        assert cursor.execute.call_args.args[1] == ("USERS",)
+        assert [(c.name, c.is_primary_key) for c in columns] == [("ID", True), ("NAME", False)]
+
+    def test_data_types(self):
+        conn, _ = _conn_with_rows(
+            [
+                ("CODE", 14, 3, 0, None),
+                ("NAME", 37, 50, 0, None),
+                ("NOTES", 261, None, 1, None),
+                ("PAYLOAD", 261, None, 0, None),
+                ("WEIRD", 999, None, 0, None),
+            ]
+        )
+
+        columns = FirebirdAdapter().get_columns(conn, "users")
+
+        assert [c.data_type for c in columns] == [
+            "CHAR(3)",
+            "VARCHAR(50)",
+            "BLOB (text)",
+            "BLOB",
+            "UNKNOWN",
+        ]
+
+
+class TestFirebirdExecuteNonQuery:
+    def test_success_commits_once(self):
+        conn, cursor = _conn_with_rows([])
+        cursor.rowcount = 3
+
+        assert FirebirdAdapter().execute_non_query(conn, "DELETE FROM t") == 3
+        assert conn.commit.call_count == 1
+        conn.rollback.assert_not_called()
+
+    def test_failure_rolls_back(self):
+        conn, cursor = _conn_with_rows([])
+        cursor.execute.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            FirebirdAdapter().execute_non_query(conn, "DELETE FROM t")
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called_once()
@@ -0,0 +1,102 @@
+"""Tests for skipping redundant footer rebuilds."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+from sqlit.core.input_context import InputContext
+from sqlit.core.vim import VimMode
+from sqlit.domains.shell.ui.mixins.ui_status import UIStatusMixin
+
+
+def _context(**overrides: Any) -> InputContext:
+    base = InputContext(
+        focus="explorer",
+        vim_mode=VimMode.NORMAL,
+        leader_pending=False,
+        leader_menu="leader",
+        tree_filter_active=False,
+        tree_multi_select_active=False,
+        tree_visual_mode_active=False,
+        autocomplete_visible=False,
+        results_filter_active=False,
+        value_view_active=False,
+        value_view_tree_mode=False,
+        value_view_is_json=False,
+        query_executing=False,
+        modal_open=False,
+        has_connection=False,
+        current_connection_name=None,
+        tree_node_kind=None,
+        tree_node_connection_name=None,
+        tree_node_connection_selected=False,
+        last_result_is_error=False,
+        has_results=False,
+    )
+    return replace(base, **overrides)
+
+
+class _Footer:
+    def __init__(self) -> None:
+        self.updates = 0
+
+    def set_bindings(self, left: list[Any], right: list[Any]) -> None:
+        self.updates += 1
+
+    def set_key_color(self, color: str) -> None:
+        pass
+
+
+class _StateMachine:
+    def get_display_bindings(self, ctx: InputContext) -> tuple[list[Any], list[Any]]:
+        return [], []
+
+
+class _Host(UIStatusMixin):
+    theme = "textual-dark"
+
+    def __init__(self) -> None:
+        self.footer = _Footer()
+        self.ctx = _context()
+        self._state_machine = _StateMachine()
+
+    def query_one(self, *_args: Any) -> _Footer:
+        return self.footer
+
+    def _get_input_context(self) -> InputContext:
+        return self.ctx
+
+    def _get_mode_colors(self) -> tuple[str, str]:
+        return "#fff", "#0f0"
+
+
+def test_unchanged_context_skips_footer_rebuild() -> None:
+    host = _Host()
+
+    host._update_footer_bindings()
+    host._update_footer_bindings()
+
+    assert host.footer.updates == 1
+
+
+def test_context_or_theme_change_rebuilds_footer() -> None:
+    host = _Host()
+    host._update_footer_bindings()
+
+    host.ctx = _context(modal_open=True)
+    host._update_footer_bindings()
+    host.theme = "nord"
+    host._update_footer_bindings()
+
+    assert host.footer.updates == 3
+
+
+def test_invalidate_forces_footer_rebuild() -> None:
+    host = _Host()
+    host._update_footer_bindings()
+
+    host._invalidate_footer_bindings()
+    host._update_footer_bindings()
+
+    assert host.footer.updates == 2
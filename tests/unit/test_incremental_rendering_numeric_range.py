@@ -55,3 +55,17 @@ async def test_incremental_rendering_handles_numeric_range_values():
             await pilot.pause(0.05)
 
         assert app.results_table.row_count == len(rows)
+
+
+def test_coerce_columns_to_str_only_touches_flagged_columns():
+    """Batch coercion should stringify flagged columns and keep other values intact."""
+    from sqlit.domains.query.ui.mixins.query_results import _coerce_columns_to_str
+
+    rows = [(1, Decimal("1.50"), NumericRange(0, 2)), (2, None, None)]
+
+    coerced = _coerce_columns_to_str(rows, {2})
+
+    assert coerced[0][0] == 1
+    assert coerced[0][1] == Decimal("1.50")
+    assert coerced[0][2] == "NumericRange(0, 2, '[)')"
+    assert coerced[1] == (2, None, None)
@@ -222,20 +222,35 @@ class TestMSSQLAdapterQueries:
         cursor = MagicMock()
         mock_conn.cursor.return_value = cursor
 
-        # First call returns PK columns, second returns all columns
-        cursor.fetchall.side_effect = [
-            [("id",)],  # Primary key columns
-            [("id", "int"), ("name", "varchar"), ("email", "varchar")],  # All columns
-        ]
+        # One query returns every column with its primary-key flag
+        cursor.fetchall.return_value = [("id", "int", 1), ("name", "varchar", 0), ("email", "varchar", 0)]
 
         result = adapter.get_columns(mock_conn, "Users", database="TestDB", schema="dbo")
 
+        column_queries = [c for c in cursor.execute.call_args_list if "INFORMATION_SCHEMA.COLUMNS" in c[0][0]]
+        assert len(column_queries) == 1
+        assert column_queries[0][0][1] == ("dbo", "Users", "dbo", "Users")
         assert len(result) == 3
         assert result[0].name == "id"
         assert result[0].is_primary_key is True
         assert result[1].name == "name"
         assert result[1].is_primary_key is False
 
+    def test_execute_query_returns_tuples_and_truncates(self, adapter):
+        """Rows come back as plain tuples, capped at max_rows."""
+        mock_conn = MagicMock()
+        cursor = MagicMock()
+        mock_conn.cursor.return_value = cursor
+        cursor.description = [("id",), ("name",)]
+        cursor.fetchmany.return_value = [[1, "a"], [2, "b"], [3, "c"]]
+
+        columns, rows, truncated = adapter.execute_query(mock_conn, "SELECT id, name FROM t", max_rows=2)
+
+        assert columns == ["id", "name"]
+        assert rows == [(1, "a"), (2, "b")]
+        assert truncated is True
+        cursor.fetchmany.assert_called_once_with(3)
+
 
 class TestMSSQLAdapterAzureAdPreflight:
     """Pre-flight Entra-token check for ad_default auth.
@@ -411,6 +426,31 @@ class TestMSSQLAdapterAzureAdPreflight:
         assert result == "freshly-acquired-jwt"
         save_mock.assert_called_once_with("freshly-acquired-jwt", 9_999_999_999)
 
+    def test_preflight_reuses_credential_across_refreshes(self, ad_default_config):
+        """The credential chain is built once per adapter, so a refresh
+        goes straight to the credential that worked last time."""
+        from sqlit.domains.connections.providers.mssql.adapter import SQLServerAdapter
+
+        fake_token = MagicMock()
+        fake_token.token = "jwt"
+        fake_token.expires_on = 9_999_999_999
+
+        fake_azure_identity = MagicMock()
+        fake_azure_identity.DefaultAzureCredential.return_value.get_token.return_value = fake_token
+
+        with patch.dict("sys.modules", {
+            "azure": MagicMock(),
+            "azure.core": MagicMock(),
+            "azure.core.exceptions": MagicMock(),
+            "azure.identity": fake_azure_identity,
+        }):
+            adapter = SQLServerAdapter()
+            adapter._preflight_azure_credentials(ad_default_config)
+            adapter._preflight_azure_credentials(ad_default_config)
+
+        assert fake_azure_identity.DefaultAzureCredential.call_count == 1
+        assert fake_azure_identity.DefaultAzureCredential.return_value.get_token.call_count == 2
+
 
 class TestMSSQLAdapterAccessTokenAttach:
     """connect() must hand the pre-acquired token directly to the ODBC driver
@@ -592,3 +632,21 @@ class TestMSSQLTokenCache:
         assert loaded.expires_on == expires
         # 0600 — owner read/write only
         assert oct(os.stat(cache_file).st_mode & 0o777) == "0o600"
+
+    def test_load_reuses_token_in_process(self, tmp_path, monkeypatch):
+        """After one read the token is served from memory, not the file."""
+        import time
+
+        from sqlit.domains.connections.providers.mssql import token_cache
+
+        cache_file = tmp_path / "cache.json"
+        monkeypatch.setattr(token_cache, "CACHE_FILE", cache_file)
+        token_cache.save("my-jwt", int(time.time()) + 3600)
+
+        cache_file.write_text("not json", encoding="utf-8")
+        loaded = token_cache.load()
+        assert loaded is not None
+        assert loaded.token == "my-jwt"
+
+        token_cache.clear()
+        assert token_cache.load() is None
@@ -0,0 +1,50 @@
+"""Tests for coalescing status bar redraws from notifications."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from sqlit.domains.shell.ui.mixins.ui_status import UIStatusMixin
+
+
+class _Host(UIStatusMixin):
+    def __init__(self) -> None:
+        self._notification_history = deque(maxlen=10)
+        self.pending: list[Any] = []
+        self.redraws: list[str] = []
+
+    def call_later(self, callback: Any, *args: Any, **kwargs: Any) -> bool:
+        self.pending.append(callback)
+        return True
+
+    def _update_status_bar(self) -> None:
+        self.redraws.append(self._last_notification.message)
+
+    def run_pending(self) -> None:
+        pending, self.pending = self.pending, []
+        for callback in pending:
+            callback()
+
+
+def test_notification_burst_redraws_status_bar_once() -> None:
+    host = _Host()
+
+    host.notify("first")
+    host.notify("second", severity="warning")
+    host.notify("third")
+    host.run_pending()
+
+    assert host.redraws == ["third"]
+    assert [entry[1] for entry in host._notification_history] == ["first", "second", "third"]
+
+
+def test_notification_after_redraw_schedules_again() -> None:
+    host = _Host()
+
+    host.notify("first")
+    host.run_pending()
+    host.notify("second")
+    host.run_pending()
+
+    assert host.redraws == ["first", "second"]
@@ -86,3 +86,32 @@ class TestQueryTextAreaTabBehavior:
     def test_query_text_area_tab_insert_string(self) -> None:
         ta = QueryTextArea()
         assert ta._tab_insert_string() == "\t"
+
+
+class TestActionKeyIndex:
+    """resolve_action's per-key index must follow keymap swaps."""
+
+    def test_index_rebuilt_when_keymap_changes(self) -> None:
+        from sqlit.core.keymap import ActionKeyDef, KeymapProvider, reset_keymap, set_keymap
+
+        class _Keymap(KeymapProvider):
+            def __init__(self, action_keys: list[ActionKeyDef]) -> None:
+                self._action_keys = action_keys
+
+            def get_leader_commands(self) -> list:
+                return []
+
+            def get_action_keys(self) -> list[ActionKeyDef]:
+                return self._action_keys
+
+        ctx = make_context()
+        try:
+            set_keymap(_Keymap([ActionKeyDef("f5", "execute_query", None)]))
+            assert resolve_action("f5", ctx, is_allowed=lambda name: True) == "execute_query"
+            assert resolve_action("f6", ctx, is_allowed=lambda name: True) is None
+
+            set_keymap(_Keymap([ActionKeyDef("f6", "execute_query", None)]))
+            assert resolve_action("f5", ctx, is_allowed=lambda name: True) is None
+            assert resolve_action("f6", ctx, is_allowed=lambda name: True) == "execute_query"
+        finally:
+            reset_keymap()
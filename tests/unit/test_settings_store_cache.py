@@ -0,0 +1,50 @@
+"""Tests for SettingsStore read caching."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from sqlit.domains.shell.store.settings import SettingsStore
+
+
+def test_unchanged_file_is_parsed_once(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"theme": "nord", "custom_themes": ["a"]}), encoding="utf-8")
+    store = SettingsStore(file_path=path)
+
+    reads = 0
+    original = store._read_raw
+
+    def counting_read():
+        nonlocal reads
+        reads += 1
+        return original()
+
+    monkeypatch.setattr(store, "_read_raw", counting_read)
+
+    first = store.load_all()
+    first["custom_themes"].append("b")
+    second = store.load_all()
+
+    assert reads == 1
+    assert second == {"theme": "nord", "custom_themes": ["a"]}
+
+
+def test_save_and_external_edit_are_picked_up(tmp_path: Path) -> None:
+    path = tmp_path / "settings.json"
+    store = SettingsStore(file_path=path)
+    assert store.load_all() == {}
+
+    store.save_all({"theme": "nord"})
+    assert store.load_all() == {"theme": "nord"}
+
+    SettingsStore(file_path=path).save_all({"theme": "dracula", "vim": True})
+    assert store.load_all() == {"theme": "dracula", "vim": True}
+
+
+def test_invalid_json_loads_as_empty(tmp_path: Path) -> None:
+    path = tmp_path / "settings.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert SettingsStore(file_path=path).load_all() == {}
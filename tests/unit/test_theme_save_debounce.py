@@ -0,0 +1,75 @@
+"""Tests for debounced theme persistence in ThemeManager."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlit.domains.shell.app.theme_manager import THEME_SAVE_DEBOUNCE_S, ThemeManager
+
+
+class _FakeTimer:
+    def __init__(self, callback: Any) -> None:
+        self.callback = callback
+        self.stopped = False
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+class _FakeApp:
+    theme = "textual-dark"
+    available_themes: dict[str, Any] = {}
+
+    def __init__(self) -> None:
+        self.timers: list[tuple[float, _FakeTimer]] = []
+
+    @property
+    def query_input(self) -> Any:
+        raise RuntimeError("not mounted")
+
+    def set_timer(self, delay: float, callback: Any, *, name: str | None = None, pause: bool = False) -> _FakeTimer:
+        timer = _FakeTimer(callback)
+        self.timers.append((delay, timer))
+        return timer
+
+
+class _CountingStore:
+    def __init__(self) -> None:
+        self.settings: dict[str, Any] = {}
+        self.saves = 0
+
+    def load_all(self) -> dict[str, Any]:
+        return dict(self.settings)
+
+    def save_all(self, settings: dict[str, Any]) -> None:
+        self.saves += 1
+        self.settings = dict(settings)
+
+
+def test_rapid_theme_changes_coalesce_into_one_write() -> None:
+    app = _FakeApp()
+    store = _CountingStore()
+    manager = ThemeManager(app, settings_store=store)  # type: ignore[arg-type]
+
+    for name in ("nord", "gruvbox", "dracula"):
+        manager.on_theme_changed(name)
+
+    assert store.saves == 0
+    assert [delay for delay, _ in app.timers] == [THEME_SAVE_DEBOUNCE_S] * 3
+    assert all(timer.stopped for _, timer in app.timers[:-1])
+
+    app.timers[-1][1].callback()
+    assert store.saves == 1
+    assert store.settings["theme"] == "dracula"
+
+
+def test_flush_without_pending_change_is_noop() -> None:
+    store = _CountingStore()
+    manager = ThemeManager(_FakeApp(), settings_store=store)  # type: ignore[arg-type]
+
+    manager.on_theme_changed("nord")
+    manager.flush_theme_save()
+    manager.flush_theme_save()
+
+    assert store.saves == 1
+    assert store.settings["theme"] == "nord"